@@ -4,7 +4,6 @@ CLI interface for VEO-FCP video generation pipeline
 """
 import os
 import sys
-import json
 import click
 from pathlib import Path
 from dotenv import load_dotenv
@@ -12,9 +11,6 @@ from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from src.workflow import VideoProductionWorkflow
-from src.models.prompt import VideoPrompt, SceneConfig
-
 # Load environment variables
 load_dotenv()
 
@@ -39,12 +35,17 @@ def cli():
 @click.option('--input-video', help='Path to input video for extension (1-30s) or GCS URI (gs://...)')
 @click.option('--input-image', help='Path to input image for image-to-video (first frame)')
 @click.option('--skip-lipsync', is_flag=True, help='Skip lip-sync step')
+@click.option('--output-format', default='prores', type=click.Choice(['prores', 'mp4']),
+              help='Final deliverable: ProRes for FCP, or the MP4 as generated (skips encoding)')
 @click.option('--analyze', is_flag=True, help='Analyze video with Claude after generation')
 @click.option('--projects-root', default='./projects', help='Root directory for all projects')
 @click.option('--project-name', default='default', help='Project name (e.g., kremlin, sveta-running-kherson)')
 def generate(scene_id, prompt, character, camera, lighting, emotion, dialogue,
-             voice_id, input_video, input_image, skip_lipsync, analyze, projects_root, project_name):
+             voice_id, input_video, input_image, skip_lipsync, output_format, analyze,
+             projects_root, project_name):
     """Generate a video scene with optional TTS and lip-sync"""
+    from src.workflow import VideoProductionWorkflow
+    from src.models.prompt import VideoPrompt, SceneConfig
 
     console.print(f"\n[bold cyan]VEO-FCP Video Generation Pipeline[/bold cyan]")
     console.print(f"Project: [yellow]{project_name}[/yellow]")
@@ -83,7 +84,8 @@ def generate(scene_id, prompt, character, camera, lighting, emotion, dialogue,
                 voice_id=voice_id,
                 skip_lipsync=skip_lipsync,
                 input_video=input_video,
-                input_image=input_image
+                input_image=input_image,
+                output_format=output_format
             )
 
         # Display results
@@ -94,11 +96,11 @@ def generate(scene_id, prompt, character, camera, lighting, emotion, dialogue,
         table.add_column("Path", style="yellow")
 
         for key, value in result.items():
-            if key not in ['scene_id', 'scene_path'] and value:
+            if key not in ['scene_id', 'scene_path', 'final'] and value:
                 table.add_row(key.replace('_', ' ').title(), value)
 
         console.print(table)
-        console.print(f"\nFinal ProRes video: [green]{result.get('final_prores')}[/green]\n")
+        console.print(f"\nFinal video: [green]{result.get('final')}[/green]\n")
 
         # Run video analysis if requested
         if analyze:
@@ -146,6 +148,8 @@ def generate(scene_id, prompt, character, camera, lighting, emotion, dialogue,
     except Exception as e:
         console.print(f"\n[bold red]✗ Error:[/bold red] {str(e)}\n")
         sys.exit(1)
+    finally:
+        workflow.close()
 
 
 @cli.command()
@@ -153,30 +157,23 @@ def generate(scene_id, prompt, character, camera, lighting, emotion, dialogue,
               help='JSON config file with scene definitions')
 @click.option('--voice-id', help='ElevenLabs voice ID')
 @click.option('--skip-lipsync', is_flag=True, help='Skip lip-sync step')
+@click.option('--output-format', default='prores', type=click.Choice(['prores', 'mp4']),
+              help='Final deliverable: ProRes for FCP, or the MP4 as generated (skips encoding)')
 @click.option('--projects-root', default='./projects', help='Root directory for all projects')
 @click.option('--project-name', default='default', help='Project name (e.g., kremlin, sveta-running-kherson)')
-def batch(config_file, voice_id, skip_lipsync, projects_root, project_name):
+def batch(config_file, voice_id, skip_lipsync, output_format, projects_root, project_name):
     """Process multiple scenes from a config file"""
+    from src.workflow import VideoProductionWorkflow
+    from src.models.prompt import BatchConfig
 
     console.print(f"\n[bold cyan]VEO-FCP Batch Processing[/bold cyan]")
     console.print(f"Project: [yellow]{project_name}[/yellow]\n")
 
-    # Load config file
-    with open(config_file, 'r') as f:
-        config_data = json.load(f)
-
-    scenes = config_data.get('scenes', [])
-    console.print(f"Processing {len(scenes)} scenes...\n")
+    # Load config file straight into scene configs (parsed and validated in one pass)
+    with open(config_file, 'rb') as f:
+        scene_configs = BatchConfig.model_validate_json(f.read()).scenes
 
-    # Create scene configs
-    scene_configs = []
-    for scene_data in scenes:
-        video_prompt = VideoPrompt(**scene_data['prompt'])
-        scene_config = SceneConfig(
-            scene_id=scene_data['scene_id'],
-            prompt=video_prompt
-        )
-        scene_configs.append(scene_config)
+    console.print(f"Processing {len(scene_configs)} scenes...\n")
 
     # Initialize workflow
     workflow = VideoProductionWorkflow(projects_root=projects_root, project_name=project_name)
@@ -186,7 +183,8 @@ def batch(config_file, voice_id, skip_lipsync, projects_root, project_name):
         results = workflow.process_multiple_scenes(
             scene_configs,
             voice_id=voice_id,
-            skip_lipsync=skip_lipsync
+            skip_lipsync=skip_lipsync,
+            output_format=output_format
         )
 
         # Display results
@@ -195,7 +193,7 @@ def batch(config_file, voice_id, skip_lipsync, projects_root, project_name):
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Scene ID", style="cyan")
         table.add_column("Status", style="yellow")
-        table.add_column("Final ProRes", style="green")
+        table.add_column("Final Video", style="green")
 
         for result in results:
             scene_id = result.get('scene_id', 'Unknown')
@@ -205,7 +203,7 @@ def batch(config_file, voice_id, skip_lipsync, projects_root, project_name):
                 table.add_row(
                     scene_id,
                     "[green]Success[/green]",
-                    result.get('final_prores', 'N/A')
+                    result.get('final', 'N/A')
                 )
 
         console.print(table)
@@ -214,6 +212,8 @@ def batch(config_file, voice_id, skip_lipsync, projects_root, project_name):
     except Exception as e:
         console.print(f"\n[bold red]✗ Error:[/bold red] {str(e)}\n")
         sys.exit(1)
+    finally:
+        workflow.close()
 
 
 @cli.command()
@@ -221,9 +221,11 @@ def batch(config_file, voice_id, skip_lipsync, projects_root, project_name):
 @click.option('--project-name', default='default', help='Project name (e.g., kremlin, sveta-running-kherson)')
 def status(projects_root, project_name):
     """Show project status"""
+    from src.utils.scene_manager import SceneManager
 
-    workflow = VideoProductionWorkflow(projects_root=projects_root, project_name=project_name)
-    project_status = workflow.get_project_status()
+    # Status only reads scene metadata, so skip building the API clients
+    scene_manager = SceneManager(projects_root=projects_root, project_name=project_name)
+    project_status = scene_manager.get_project_structure()
 
     console.print(f"\n[bold cyan]Project Status[/bold cyan]")
     console.print(f"Project: [yellow]{project_status['project_name']}[/yellow]")
@@ -534,7 +536,8 @@ def setup():
 
     # Check if .env exists
     env_path = Path('.env')
-    if env_path.exists():
+    overwrite = env_path.exists()
+    if overwrite:
         console.print("[yellow].env file already exists[/yellow]")
         if not click.confirm("Overwrite?"):
             return
@@ -568,8 +571,25 @@ PROJECT_NAME=default
 FFMPEG_PRORES_PROFILE=2
 """
 
-    with open('.env', 'w') as f:
-        f.write(env_content)
+    # The file holds API keys, so keep it private to the user
+    if overwrite:
+        # Write a temp file and rename it over .env so an interrupted write
+        # never leaves a truncated config behind
+        tmp_path = '.env.tmp'
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(env_content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, env_path)
+    else:
+        try:
+            fd = os.open(env_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            console.print("[bold red]✗ .env was created by another process, not overwriting[/bold red]")
+            return
+        with os.fdopen(fd, 'w') as f:
+            f.write(env_content)
 
     console.print("\n[bold green]✓ Configuration saved to .env[/bold green]")
     console.print("\nYou can now start using VEO-FCP!\n")
@@ -43,7 +43,7 @@ def example_single_scene():
 
         print("\nSuccess! Generated files:")
         print(f"  Raw video: {result['raw_video']}")
-        print(f"  ProRes video: {result['prores_video']}")
+        print(f"  ProRes video: {result.get('prores_video', 'N/A')}")
         print(f"  Audio: {result.get('audio', 'N/A')}")
         print(f"  Final ProRes: {result['final_prores']}")
         print(f"\nImport {result['final_prores']} into Final Cut Pro!")
@@ -1,5 +1,11 @@
-from .veo_client import VeoClient
-from .tts_client import TTSClient
-from .lipsync_client import LipSyncClient
+from src.utils.lazy import lazy_exports
+
+# Client modules pull in their provider SDKs, so they are only imported when
+# one of these names is first accessed
+__getattr__ = lazy_exports(__name__, {
+    'VeoClient': '.veo_client',
+    'TTSClient': '.tts_client',
+    'LipSyncClient': '.lipsync_client',
+})
 
 __all__ = ['VeoClient', 'TTSClient', 'LipSyncClient']
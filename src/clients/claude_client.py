@@ -107,17 +107,17 @@ class ClaudeClient:
                         frame_paths.append(frame_path)
                 except subprocess.CalledProcessError:
                     # Skip frames that fail to extract
-                    logger.warning(f"Failed to extract frame at {ts}s, skipping")
+                    logger.warning("Failed to extract frame at %ss, skipping", ts)
                     continue
 
-            logger.info(f"Extracted {len(frame_paths)} frames from {video_path}")
+            logger.info("Extracted %s frames from %s", len(frame_paths), video_path)
             return frame_paths
 
         except subprocess.CalledProcessError as e:
-            logger.error(f"FFmpeg error extracting frames: {e.stderr}")
+            logger.error("FFmpeg error extracting frames: %s", e.stderr)
             raise
         except Exception as e:
-            logger.error(f"Error extracting frames: {str(e)}")
+            logger.error("Error extracting frames: %s", e)
             raise
 
     def _encode_image(self, image_path: str) -> tuple[str, str]:
@@ -213,7 +213,7 @@ Provide a cohesive description that would help someone understand the video's co
             })
 
             # Call Claude API
-            logger.info(f"Analyzing video with {len(frame_paths)} frames using {self.model}")
+            logger.info("Analyzing video with %s frames using %s", len(frame_paths), self.model)
             response = self.client.messages.create(
                 model=self.model,
                 max_tokens=1500,
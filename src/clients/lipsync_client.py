@@ -2,23 +2,131 @@
 Lip-sync API client using D-ID Creative Reality Studio
 """
 import os
-import time
+import json
+import shutil
 import logging
+import threading
 import requests
-from typing import Optional, Dict, Any
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Dict, Any, Callable, Iterator, List
+
+from src.utils import jsonio
+from src.utils.cache import cache_key, get_or_compute, hash_file
+from src.utils.fs import ensure_parent_dir
+from src.utils.gcs import generate_signed_url
+from src.utils.http import get_session
+from src.utils.polling import PollScheduler
 
 logger = logging.getLogger(__name__)
 
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+    logger.warning("requests-toolbelt not installed, uploads will be buffered in memory. "
+                   "Install with: pip install requests-toolbelt")
+
+
+class DIDWebhookListener:
+    """
+    Local HTTP endpoint for D-ID talk completion webhooks
+
+    D-ID POSTs the talk payload to the webhook URL when rendering finishes.
+    The listener only signals that a talk is worth re-checking; the status
+    itself is always confirmed through the API, so a forged request can't
+    inject a result URL.
+    """
+
+    def __init__(self, public_url: str, port: int = 8765, host: str = "0.0.0.0"):
+        """
+        Start the webhook listener on a background thread
+
+        Args:
+            public_url: Publicly reachable URL that forwards to this listener
+            port: Local port to listen on
+            host: Local interface to bind
+        """
+        self.public_url = public_url
+        self._callbacks: List[Callable[[str], None]] = []
+        self._lock = threading.Lock()
+
+        listener = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                try:
+                    payload = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    payload = {}
+
+                talk_id = payload.get("id") if isinstance(payload, dict) else None
+                if talk_id:
+                    listener.notify(talk_id)
+
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                logger.debug("Webhook: " + format, *args)
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+        logger.info("Listening for D-ID webhooks on port %s (%s)", port, public_url)
+
+    def add_callback(self, callback: Callable[[str], None]):
+        """Register a function called with the talk ID of each webhook"""
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def notify(self, talk_id: str):
+        """Dispatch a webhook to the registered callbacks"""
+        with self._lock:
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            callback(talk_id)
+
+
+_webhook_listeners: Dict[int, DIDWebhookListener] = {}
+_webhook_lock = threading.Lock()
+
+
+def _get_webhook_listener(public_url: str, port: int) -> DIDWebhookListener:
+    """Return the process-wide listener for a port, starting it on first use"""
+    with _webhook_lock:
+        if port not in _webhook_listeners:
+            _webhook_listeners[port] = DIDWebhookListener(public_url, port=port)
+        return _webhook_listeners[port]
+
 
 class LipSyncClient:
     """Client for D-ID lip-sync API"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    TALK_CONFIG = {
+        "fluent": True,
+        "pad_audio": 0.0,
+        "stitch": True
+    }
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        webhook_url: Optional[str] = None,
+        webhook_port: Optional[int] = None,
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize D-ID lip-sync client
 
         Args:
             api_key: D-ID API key
+            webhook_url: Public URL forwarding to the local webhook listener
+                         (enables completion callbacks instead of polling)
+            webhook_port: Local port for the webhook listener
+            session: HTTP session to use (defaults to the shared session)
         """
         self.api_key = api_key or os.getenv("DID_API_KEY")
         if not self.api_key:
@@ -30,6 +138,27 @@ class LipSyncClient:
             "Content-Type": "application/json"
         }
 
+        # Pooled session so uploads, status polls and downloads reuse
+        # TCP/TLS connections. Auth stays per-request: the session is shared
+        # and the result URL is a pre-signed storage link that must not
+        # receive the D-ID key.
+        self.session = session or get_session()
+
+        # (connect, read) timeouts for every request; without them a stalled
+        # connection would hang a scene thread indefinitely
+        self.timeout = (10, 60)
+
+        # One scheduler thread polls every in-flight talk of this client
+        self._poller = PollScheduler(self._poll_talk, name="did-poller")
+
+        # Optional completion webhooks; polling remains the fallback
+        webhook_url = webhook_url or os.getenv("DID_WEBHOOK_URL")
+        self.webhook = None
+        if webhook_url:
+            port = webhook_port or int(os.getenv("DID_WEBHOOK_PORT", "8765"))
+            self.webhook = _get_webhook_listener(webhook_url, port)
+            self.webhook.add_callback(self._poller.poll_now)
+
         logger.info("Initialized D-ID lip-sync client")
 
     def create_talk_video(
@@ -66,27 +195,23 @@ class LipSyncClient:
                     "type": "audio",
                     "audio_url": audio_url
                 },
-                "config": {
-                    "fluent": True,
-                    "pad_audio": 0.0,
-                    "stitch": True
-                }
+                "config": self.TALK_CONFIG
             }
 
             if webhook_url:
                 payload["webhook"] = webhook_url
 
-            response = requests.post(endpoint, json=payload, headers=self.headers)
+            response = self.session.post(endpoint, json=payload, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
 
             result = response.json()
             talk_id = result.get("id")
 
-            logger.info(f"Created D-ID talk video with ID: {talk_id}")
+            logger.info("Created D-ID talk video with ID: %s", talk_id)
             return result
 
         except Exception as e:
-            logger.error(f"Error creating lip-synced video: {str(e)}")
+            logger.error("Error creating lip-synced video: %s", e)
             raise
 
     def _upload_video(self, video_path: str) -> str:
@@ -94,7 +219,7 @@ class LipSyncClient:
         Upload video to D-ID (or return URL if already remote)
 
         Args:
-            video_path: Path to video file or URL
+            video_path: Path to video file, URL, or GCS URI (gs://...)
 
         Returns:
             Video URL
@@ -103,25 +228,25 @@ class LipSyncClient:
         if video_path.startswith(('http://', 'https://')):
             return video_path
 
+        # Objects already in GCS are shared via a signed URL instead of
+        # being uploaded again
+        if video_path.startswith('gs://'):
+            return generate_signed_url(video_path)
+
         # Upload to D-ID
-        logger.info(f"Uploading video: {video_path}")
+        logger.info("Uploading video: %s", video_path)
 
         try:
             endpoint = f"{self.base_url}/images"
-
-            with open(video_path, 'rb') as f:
-                files = {'image': f}
-                headers = {"Authorization": self.headers["Authorization"]}
-                response = requests.post(endpoint, files=files, headers=headers)
-                response.raise_for_status()
+            response = self._post_file(endpoint, 'image', video_path, 'video/mp4')
 
             result = response.json()
             video_url = result.get("url")
-            logger.info(f"Video uploaded: {video_url}")
+            logger.info("Video uploaded: %s", video_url)
             return video_url
 
         except Exception as e:
-            logger.error(f"Error uploading video: {str(e)}")
+            logger.error("Error uploading video: %s", e)
             raise
 
     def _upload_audio(self, audio_path: str) -> str:
@@ -139,26 +264,59 @@ class LipSyncClient:
             return audio_path
 
         # Upload to D-ID
-        logger.info(f"Uploading audio: {audio_path}")
+        logger.info("Uploading audio: %s", audio_path)
 
         try:
             endpoint = f"{self.base_url}/audios"
-
-            with open(audio_path, 'rb') as f:
-                files = {'audio': f}
-                headers = {"Authorization": self.headers["Authorization"]}
-                response = requests.post(endpoint, files=files, headers=headers)
-                response.raise_for_status()
+            response = self._post_file(endpoint, 'audio', audio_path, 'audio/mpeg')
 
             result = response.json()
             audio_url = result.get("url")
-            logger.info(f"Audio uploaded: {audio_url}")
+            logger.info("Audio uploaded: %s", audio_url)
             return audio_url
 
         except Exception as e:
-            logger.error(f"Error uploading audio: {str(e)}")
+            logger.error("Error uploading audio: %s", e)
             raise
 
+    def _post_file(
+        self,
+        endpoint: str,
+        field: str,
+        file_path: str,
+        content_type: str
+    ) -> requests.Response:
+        """
+        POST a local file as multipart form data
+
+        Streams the file from disk when requests-toolbelt is available, so
+        large Veo outputs are not read into memory before sending.
+
+        Args:
+            endpoint: Upload endpoint URL
+            field: Form field name
+            file_path: Path to the file
+            content_type: MIME type of the file
+
+        Returns:
+            Response from the upload endpoint
+        """
+        headers = {"Authorization": self.headers["Authorization"]}
+
+        with open(file_path, 'rb') as f:
+            if MultipartEncoder is not None:
+                encoder = MultipartEncoder(
+                    fields={field: (os.path.basename(file_path), f, content_type)}
+                )
+                headers["Content-Type"] = encoder.content_type
+                response = self.session.post(endpoint, data=encoder, headers=headers, timeout=self.timeout)
+            else:
+                files = {field: (os.path.basename(file_path), f, content_type)}
+                response = self.session.post(endpoint, files=files, headers=headers, timeout=self.timeout)
+
+        response.raise_for_status()
+        return response
+
     def get_talk_status(self, talk_id: str) -> Dict[str, Any]:
         """
         Get status of a talk video
@@ -171,104 +329,179 @@ class LipSyncClient:
         """
         try:
             endpoint = f"{self.base_url}/talks/{talk_id}"
-            response = requests.get(endpoint, headers=self.headers)
+            response = self.session.get(endpoint, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
 
-            return response.json()
+            # Polled repeatedly, so decode the raw bytes with orjson when available
+            return jsonio.loads(response.content)
 
         except Exception as e:
-            logger.error(f"Error getting talk status: {str(e)}")
+            logger.error("Error getting talk status: %s", e)
             raise
 
     def wait_for_completion(
         self,
         talk_id: str,
         timeout: int = 600,
-        poll_interval: int = 5
+        poll_interval: int = 5,
+        max_interval: int = 30
     ) -> Dict[str, Any]:
         """
         Wait for lip-sync video to complete
 
+        Talks are polled by the client's shared scheduler thread with
+        exponential backoff starting at ``poll_interval`` and capped at
+        ``max_interval``. When a webhook listener is configured the talk is
+        re-checked as soon as D-ID calls back, and polling only runs every
+        ``max_interval`` seconds as a fallback.
+
         Args:
             talk_id: Talk ID from create_talk_video
             timeout: Maximum wait time in seconds
-            poll_interval: Time between status checks in seconds
+            poll_interval: Initial time between status checks in seconds
+            max_interval: Maximum time between status checks in seconds
 
         Returns:
             Dictionary with completed video information
         """
-        logger.info(f"Waiting for talk {talk_id} to complete...")
+        logger.info("Waiting for talk %s to complete...", talk_id)
 
-        start_time = time.time()
+        # With webhooks, polling is only a slow fallback
+        if self.webhook:
+            poll_interval = max_interval
 
-        while time.time() - start_time < timeout:
-            try:
-                status = self.get_talk_status(talk_id)
+        future = self._poller.submit(
+            talk_id,
+            initial_interval=poll_interval,
+            max_interval=max_interval
+        )
 
-                if status.get("status") == "done":
-                    logger.info(f"Talk {talk_id} completed successfully")
-                    return status
-                elif status.get("status") == "error":
-                    error_msg = status.get("error", {}).get("description", "Unknown error")
-                    raise Exception(f"Talk {talk_id} failed: {error_msg}")
+        try:
+            status = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            self._poller.cancel(talk_id)
+            raise TimeoutError(f"Talk {talk_id} did not complete within {timeout} seconds")
+        except Exception as e:
+            logger.error("Error checking talk status: %s", e)
+            raise
 
-                logger.debug(f"Talk {talk_id} status: {status.get('status')}")
-                time.sleep(poll_interval)
+        logger.info("Talk %s completed successfully", talk_id)
+        return status
 
-            except Exception as e:
-                logger.error(f"Error checking talk status: {str(e)}")
-                raise
+    def _poll_talk(self, talk_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Check a talk once for the poll scheduler
 
-        raise TimeoutError(f"Talk {talk_id} did not complete within {timeout} seconds")
+        Returns:
+            Final status when done, None while still processing
+        """
+        status = self.get_talk_status(talk_id)
 
-    def download_result(self, talk_id: str, output_path: str) -> str:
+        if status.get("status") == "done":
+            return status
+        elif status.get("status") == "error":
+            error_msg = status.get("error", {}).get("description", "Unknown error")
+            raise Exception(f"Talk {talk_id} failed: {error_msg}")
+
+        logger.debug("Talk %s status: %s", talk_id, status.get('status'))
+        return None
+
+    def download_result(
+        self,
+        talk_id: str,
+        output_path: str,
+        status: Optional[Dict[str, Any]] = None
+    ) -> str:
         """
         Download completed lip-sync video
 
         Args:
             talk_id: Talk ID
             output_path: Path to save the video
+            status: Terminal status from wait_for_completion, reused to skip
+                    another status request
 
         Returns:
             Path to downloaded video
         """
-        logger.info(f"Downloading result for talk {talk_id}")
+        logger.info("Downloading result for talk %s", talk_id)
 
         try:
-            # Get final status to get result URL
-            status = self.get_talk_status(talk_id)
+            result_url = self._get_result_url(talk_id, status)
+            self._download_sequential(result_url, output_path)
+
+            logger.info("Downloaded lip-sync video to %s", output_path)
+            return output_path
+
+        except Exception as e:
+            logger.error("Error downloading result: %s", e)
+            raise
+
+    def iter_result(
+        self,
+        talk_id: str,
+        status: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 256 * 1024
+    ) -> Iterator[bytes]:
+        """
+        Stream a completed lip-sync video as it downloads
 
-            if status.get("status") != "done":
-                raise Exception(f"Video not ready. Status: {status.get('status')}")
+        Args:
+            talk_id: Talk ID
+            status: Terminal status from wait_for_completion, reused to skip
+                    another status request
+            chunk_size: Bytes per chunk
 
-            result_url = status.get("result_url")
-            if not result_url:
-                raise Exception("No result URL found")
+        Yields:
+            Chunks of the video file in order
+        """
+        result_url = self._get_result_url(talk_id, status)
+        logger.info("Streaming result for talk %s", talk_id)
 
-            # Download video
-            response = requests.get(result_url, stream=True)
+        with self.session.get(result_url, stream=True, timeout=self.timeout) as response:
             response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    yield chunk
 
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    def _get_result_url(
+        self,
+        talk_id: str,
+        status: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Return the talk's result URL, fetching status unless a finished one is given"""
+        if status is None or status.get("status") != "done":
+            status = self.get_talk_status(talk_id)
 
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+        if status.get("status") != "done":
+            raise Exception(f"Video not ready. Status: {status.get('status')}")
 
-            logger.info(f"Downloaded lip-sync video to {output_path}")
-            return output_path
+        result_url = status.get("result_url")
+        if not result_url:
+            raise Exception("No result URL found")
 
-        except Exception as e:
-            logger.error(f"Error downloading result: {str(e)}")
-            raise
+        return result_url
+
+    def _download_sequential(self, url: str, output_path: str):
+        """Download a URL to a file over a single stream"""
+        with self.session.get(url, stream=True, timeout=self.timeout) as response:
+            response.raise_for_status()
+
+            ensure_parent_dir(output_path)
+
+            # Copy the raw stream in 1 MiB blocks instead of iterating
+            # small chunks through a Python generator
+            response.raw.decode_content = True
+            with open(output_path, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
 
     def create_and_wait(
         self,
         video_path: str,
         audio_path: str,
         output_path: str,
-        timeout: int = 600
+        timeout: int = 600,
+        stream_fn: Optional[Callable[[Iterator[bytes], str], str]] = None
     ) -> str:
         """
         Complete pipeline: create, wait, and download lip-sync video
@@ -278,16 +511,35 @@ class LipSyncClient:
             audio_path: Path to audio file
             output_path: Path to save final video
             timeout: Maximum wait time
+            stream_fn: Optional consumer for the result stream, called with
+                       the chunk iterator and output_path (which it must
+                       write) instead of a plain download; not called when
+                       the result comes from the cache
 
         Returns:
             Path to final lip-synced video
         """
-        # Create talk video
-        result = self.create_talk_video(video_path, audio_path)
-        talk_id = result.get("id")
+        def produce(path: str) -> str:
+            # Create talk video, asking D-ID to call back if a webhook is set up
+            webhook_url = self.webhook.public_url if self.webhook else None
+            result = self.create_talk_video(video_path, audio_path, webhook_url=webhook_url)
+            talk_id = result.get("id")
+
+            # Wait for completion
+            final_status = self.wait_for_completion(talk_id, timeout=timeout)
+
+            # Download result, reusing the terminal status for its result URL
+            if stream_fn is not None:
+                return stream_fn(self.iter_result(talk_id, status=final_status), path)
+            return self.download_result(talk_id, path, status=final_status)
 
-        # Wait for completion
-        self.wait_for_completion(talk_id, timeout=timeout)
+        # Remote sources (URLs, gs:// objects) can't be hashed locally
+        if not (os.path.isfile(video_path) and os.path.isfile(audio_path)):
+            return produce(output_path)
 
-        # Download result
-        return self.download_result(talk_id, output_path)
+        key = cache_key(
+            hash_file(video_path),
+            hash_file(audio_path),
+            json.dumps(self.TALK_CONFIG, sort_keys=True)
+        )
+        return get_or_compute("lipsync", key, produce, output_path)
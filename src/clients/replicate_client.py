@@ -4,11 +4,14 @@ Supports Wan 2.2/2.5 models for text-to-video and image-to-video
 """
 import os
 import time
+import uuid
 import logging
 import requests
 from typing import Optional, Dict, Any
 from pathlib import Path
 
+from src.utils.http import get_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,12 +46,13 @@ class ReplicateClient:
         },
     }
 
-    def __init__(self, api_token: Optional[str] = None):
+    def __init__(self, api_token: Optional[str] = None, session: Optional[requests.Session] = None):
         """
         Initialize Replicate API client
 
         Args:
             api_token: Replicate API token (or set REPLICATE_API_TOKEN env var)
+            session: HTTP session for downloads (defaults to the shared session)
         """
         self.api_token = api_token or os.getenv("REPLICATE_API_TOKEN")
         if not self.api_token:
@@ -68,11 +72,13 @@ class ReplicateClient:
         self.default_model = os.getenv("REPLICATE_MODEL", "wan-2.2-t2v-fast")
         self.default_resolution = os.getenv("REPLICATE_RESOLUTION", "480p")
 
+        self.session = session or get_session()
+
         # Store jobs for tracking
         self.jobs = {}
         self.job_data = {}
 
-        logger.info(f"Initialized Replicate client with model: {self.default_model}")
+        logger.info("Initialized Replicate client with model: %s", self.default_model)
 
     def generate_video(
         self,
@@ -105,7 +111,7 @@ class ReplicateClient:
         if input_image:
             if "i2v" not in model_name:
                 model_name = model_name.replace("t2v", "i2v")
-                logger.info(f"Switched to image-to-video model: {model_name}")
+                logger.info("Switched to image-to-video model: %s", model_name)
 
         # If input_video provided, extract last frame and use i2v for continuation
         if input_video and not input_image:
@@ -132,9 +138,9 @@ class ReplicateClient:
         fps = kwargs.get("fps", 16)
         num_frames = min(max(duration * fps, 81), 121)
 
-        logger.info(f"Generating video with {model_name}")
-        logger.info(f"Prompt: {prompt[:100]}...")
-        logger.info(f"Resolution: {resolution}, Frames: {num_frames}, Aspect: {aspect_ratio}")
+        logger.info("Generating video with %s", model_name)
+        logger.info("Prompt: %s...", prompt[:100])
+        logger.info("Resolution: %s, Frames: %s, Aspect: %s", resolution, num_frames, aspect_ratio)
 
         try:
             # For i2v models, enhance prompt with motion focus
@@ -144,7 +150,7 @@ class ReplicateClient:
                 # The image already establishes the scene
                 if not any(word in prompt.lower() for word in ['camera', 'pan', 'zoom', 'dolly', 'motion', 'moving', 'slowly', 'quickly']):
                     effective_prompt = f"{prompt}, cinematic motion, smooth camera movement"
-                    logger.info(f"Enhanced i2v prompt: {effective_prompt}")
+                    logger.info("Enhanced i2v prompt: %s", effective_prompt)
 
             # Prepare input parameters
             input_params = {
@@ -171,16 +177,16 @@ class ReplicateClient:
                 input_params["seed"] = kwargs["seed"]
 
             # Run the model (this blocks until complete)
-            logger.info(f"Sending request to Replicate API...")
+            logger.info("Sending request to Replicate API...")
             start_time = time.time()
 
             output = self.replicate.run(model_id, input=input_params)
 
             elapsed = time.time() - start_time
-            logger.info(f"Video generated in {elapsed:.1f}s")
+            logger.info("Video generated in %.1fs", elapsed)
 
             # Create job ID
-            job_id = f"replicate_job_{int(time.time())}"
+            job_id = f"replicate_job_{int(time.time())}_{uuid.uuid4().hex[:8]}"
 
             # Store result
             job_data = {
@@ -200,14 +206,14 @@ class ReplicateClient:
             self.jobs[job_id] = output
             self.job_data[job_id] = job_data
 
-            logger.info(f"Video generation completed: {job_id}")
+            logger.info("Video generation completed: %s", job_id)
             if isinstance(output, str):
-                logger.info(f"Output URL: {output}")
+                logger.info("Output URL: %s", output)
 
             return job_data
 
         except Exception as e:
-            logger.error(f"Error generating video: {str(e)}")
+            logger.error("Error generating video: %s", e)
             raise
 
     def _extract_first_frame(self, video_path: str) -> str:
@@ -228,11 +234,11 @@ class ReplicateClient:
             stream = ffmpeg.output(stream, frame_path, vframes=1, format='image2')
             ffmpeg.run(stream, overwrite_output=True, capture_stdout=True, capture_stderr=True)
 
-            logger.info(f"Extracted first frame to: {frame_path}")
+            logger.info("Extracted first frame to: %s", frame_path)
             return frame_path
 
         except Exception as e:
-            logger.error(f"Error extracting frame: {e}")
+            logger.error("Error extracting frame: %s", e)
             raise
 
     def _extract_last_frame(self, video_path: str) -> str:
@@ -258,11 +264,11 @@ class ReplicateClient:
             stream = ffmpeg.output(stream, frame_path, vframes=1, format='image2', update=1)
             ffmpeg.run(stream, overwrite_output=True, capture_stdout=True, capture_stderr=True)
 
-            logger.info(f"Extracted last frame to: {frame_path} (video duration: {duration:.1f}s)")
+            logger.info("Extracted last frame to: %s (video duration: %.1fs)", frame_path, duration)
             return frame_path
 
         except Exception as e:
-            logger.error(f"Error extracting last frame: {e}")
+            logger.error("Error extracting last frame: %s", e)
             # Fallback to first frame if last frame extraction fails
             logger.warning("Falling back to first frame extraction")
             return self._extract_first_frame(video_path)
@@ -308,7 +314,7 @@ class ReplicateClient:
         Returns:
             Path to the saved video file
         """
-        logger.info(f"Saving video from job {job_id} to {output_path}")
+        logger.info("Saving video from job %s to %s", job_id, output_path)
 
         if job_id not in self.job_data:
             raise ValueError(f"Job {job_id} not found")
@@ -327,20 +333,20 @@ class ReplicateClient:
                 os.makedirs(output_dir, exist_ok=True)
 
             # Download the video
-            logger.info(f"Downloading video from: {output_url}")
-            response = requests.get(output_url, stream=True, timeout=300)
-            response.raise_for_status()
+            logger.info("Downloading video from: %s", output_url)
+            with self.session.get(output_url, stream=True, timeout=300) as response:
+                response.raise_for_status()
 
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+                with open(output_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=256 * 1024):
+                        if chunk:
+                            f.write(chunk)
 
-            logger.info(f"Video saved to: {output_path}")
+            logger.info("Video saved to: %s", output_path)
             return output_path
 
         except Exception as e:
-            logger.error(f"Error saving video: {str(e)}")
+            logger.error("Error saving video: %s", e)
             raise
 
     def get_job_status(self, job_id: str) -> Dict[str, Any]:
@@ -4,11 +4,14 @@ Supports Sora 2 and Sora 2 Pro models
 """
 import os
 import time
+import uuid
 import logging
 import requests
 from typing import Optional, Dict, Any
 from pathlib import Path
 
+from src.utils.http import get_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,12 +36,13 @@ class SoraClient:
         },
     }
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, session: Optional[requests.Session] = None):
         """
         Initialize OpenAI Sora API client
 
         Args:
             api_key: OpenAI API key (or set OPENAI_API_KEY env var)
+            session: HTTP session for downloads (defaults to the shared session)
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
@@ -55,11 +59,13 @@ class SoraClient:
         self.default_model = os.getenv("SORA_MODEL", "sora-2")
         self.default_resolution = os.getenv("SORA_RESOLUTION", "720p")
 
+        self.session = session or get_session()
+
         # Store jobs for tracking
         self.jobs = {}
         self.job_data = {}
 
-        logger.info(f"Initialized Sora client with model: {self.default_model}")
+        logger.info("Initialized Sora client with model: %s", self.default_model)
 
     def generate_video(
         self,
@@ -91,24 +97,24 @@ class SoraClient:
 
         model_info = self.MODELS.get(model_name)
         if not model_info:
-            logger.warning(f"Unknown model {model_name}, using sora-2")
+            logger.warning("Unknown model %s, using sora-2", model_name)
             model_name = "sora-2"
             model_info = self.MODELS["sora-2"]
 
         # Validate duration
         max_duration = model_info["max_duration"]
         if duration > max_duration:
-            logger.warning(f"Duration {duration}s exceeds max {max_duration}s for {model_name}, clamping")
+            logger.warning("Duration %ss exceeds max %ss for %s, clamping", duration, max_duration, model_name)
             duration = max_duration
 
         # Truncate prompt if too long
         if len(prompt) > 500:
-            logger.warning(f"Prompt exceeds 500 chars, truncating")
+            logger.warning("Prompt exceeds 500 chars, truncating")
             prompt = prompt[:497] + "..."
 
-        logger.info(f"Generating video with Sora ({model_name})")
-        logger.info(f"Prompt: {prompt[:100]}...")
-        logger.info(f"Duration: {duration}s, Resolution: {resolution}, Aspect: {aspect_ratio}")
+        logger.info("Generating video with Sora (%s)", model_name)
+        logger.info("Prompt: %s...", prompt[:100])
+        logger.info("Duration: %ss, Resolution: %s, Aspect: %s", duration, resolution, aspect_ratio)
 
         try:
             start_time = time.time()
@@ -130,7 +136,7 @@ class SoraClient:
 
             # Handle image-to-video if input_image provided
             if input_image:
-                logger.info(f"Using image input: {input_image}")
+                logger.info("Using image input: %s", input_image)
                 # Read image and include in request
                 if not input_image.startswith("http"):
                     with open(input_image, "rb") as f:
@@ -142,7 +148,7 @@ class SoraClient:
 
             # Handle video-to-video if input_video provided
             if input_video:
-                logger.info(f"Video extension requested - extracting first frame")
+                logger.info("Video extension requested - extracting first frame")
                 # Sora doesn't natively support video-to-video yet,
                 # so extract first frame and use as image input
                 frame_path = self._extract_first_frame(input_video)
@@ -156,7 +162,7 @@ class SoraClient:
             video = self.client.videos.create(**create_params)
 
             # Create job ID
-            job_id = f"sora_job_{int(time.time())}"
+            job_id = f"sora_job_{int(time.time())}_{uuid.uuid4().hex[:8]}"
             video_id = video.id if hasattr(video, 'id') else str(video)
 
             # Store job info
@@ -175,13 +181,13 @@ class SoraClient:
             self.jobs[job_id] = video
             self.job_data[job_id] = job_data
 
-            logger.info(f"Video generation started: {job_id}")
-            logger.info(f"Video ID: {video_id}")
+            logger.info("Video generation started: %s", job_id)
+            logger.info("Video ID: %s", video_id)
 
             return job_data
 
         except Exception as e:
-            logger.error(f"Error generating video: {str(e)}")
+            logger.error("Error generating video: %s", e)
             raise
 
     def _extract_first_frame(self, video_path: str) -> str:
@@ -199,10 +205,10 @@ class SoraClient:
             stream = ffmpeg.input(video_path)
             stream = ffmpeg.output(stream, frame_path, vframes=1, format='image2')
             ffmpeg.run(stream, overwrite_output=True, capture_stdout=True, capture_stderr=True)
-            logger.info(f"Extracted first frame to: {frame_path}")
+            logger.info("Extracted first frame to: %s", frame_path)
             return frame_path
         except Exception as e:
-            logger.error(f"Error extracting frame: {e}")
+            logger.error("Error extracting frame: %s", e)
             raise
 
     def wait_for_completion(
@@ -228,7 +234,7 @@ class SoraClient:
         job_data = self.job_data[job_id]
         video_id = job_data["video_id"]
 
-        logger.info(f"Waiting for job {job_id} to complete...")
+        logger.info("Waiting for job %s to complete...", job_id)
         start_time = time.time()
 
         while time.time() - start_time < timeout:
@@ -237,7 +243,7 @@ class SoraClient:
                 video_status = self.client.videos.retrieve(video_id)
 
                 status = video_status.status if hasattr(video_status, 'status') else "unknown"
-                logger.info(f"Job {job_id} status: {status} (elapsed: {int(time.time() - start_time)}s)")
+                logger.info("Job %s status: %s (elapsed: %ss)", job_id, status, int(time.time() - start_time))
 
                 if status == "completed":
                     # Get the video URL
@@ -253,7 +259,7 @@ class SoraClient:
                     job_data["output_url"] = video_url
                     job_data["completed_at"] = time.time()
 
-                    logger.info(f"Job {job_id} completed successfully")
+                    logger.info("Job %s completed successfully", job_id)
                     return job_data
 
                 elif status == "failed":
@@ -263,13 +269,13 @@ class SoraClient:
                 elif status in ["queued", "in_progress", "processing"]:
                     time.sleep(poll_interval)
                 else:
-                    logger.warning(f"Unknown status: {status}")
+                    logger.warning("Unknown status: %s", status)
                     time.sleep(poll_interval)
 
             except Exception as e:
                 if "failed" in str(e).lower():
                     raise
-                logger.warning(f"Error polling status: {e}")
+                logger.warning("Error polling status: %s", e)
                 time.sleep(poll_interval)
 
         raise TimeoutError(f"Video generation timed out after {timeout}s")
@@ -285,7 +291,7 @@ class SoraClient:
         Returns:
             Path to the saved video file
         """
-        logger.info(f"Saving video from job {job_id} to {output_path}")
+        logger.info("Saving video from job %s to %s", job_id, output_path)
 
         if job_id not in self.job_data:
             raise ValueError(f"Job {job_id} not found")
@@ -303,21 +309,21 @@ class SoraClient:
                 os.makedirs(output_dir, exist_ok=True)
 
             # Download the video
-            logger.info(f"Downloading video from: {output_url}")
-            response = requests.get(output_url, stream=True, timeout=300)
-            response.raise_for_status()
+            logger.info("Downloading video from: %s", output_url)
+            with self.session.get(output_url, stream=True, timeout=300) as response:
+                response.raise_for_status()
 
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+                with open(output_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=256 * 1024):
+                        if chunk:
+                            f.write(chunk)
 
             file_size = os.path.getsize(output_path)
-            logger.info(f"Video saved to: {output_path} ({file_size / 1024 / 1024:.1f} MB)")
+            logger.info("Video saved to: %s (%.1f MB)", output_path, file_size / 1024 / 1024)
             return output_path
 
         except Exception as e:
-            logger.error(f"Error saving video: {str(e)}")
+            logger.error("Error saving video: %s", e)
             raise
 
     def get_job_status(self, job_id: str) -> Dict[str, Any]:
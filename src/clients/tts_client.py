@@ -2,12 +2,22 @@
 Text-to-Speech API client using ElevenLabs
 """
 import os
+import re
 import logging
 from typing import Optional
-from elevenlabs import generate, save, set_api_key, voices
+from elevenlabs import generate, set_api_key, voices, Voice, VoiceSettings
+
+from src.utils.cache import cache_key, get_or_compute
+from src.utils.fs import ensure_parent_dir
 
 logger = logging.getLogger(__name__)
 
+# Dialogue with nothing to pronounce (ellipses, dashes, stray punctuation)
+_UNSPOKEN_TEXT = re.compile(r"[\W_]*")
+
+# ~200 ms of silence: 8 empty MPEG-1 Layer III frames (32 kbps, 44.1 kHz, mono)
+_SILENT_MP3 = (b"\xff\xfb\x10\xc0" + bytes(100)) * 8
+
 
 class TTSClient:
     """Client for ElevenLabs Text-to-Speech API"""
@@ -35,6 +45,10 @@ class TTSClient:
 
         # Set the API key globally for the elevenlabs library
         set_api_key(self.api_key)
+
+        # Voice objects keyed by (voice_id, stability, similarity_boost)
+        self._voice_cache = {}
+
         logger.info("Initialized ElevenLabs TTS client")
 
     def generate_speech(
@@ -65,32 +79,96 @@ class TTSClient:
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
 
+        stripped = text.strip()
+        if _UNSPOKEN_TEXT.fullmatch(stripped):
+            logger.info("No speakable text in %r, writing silence", stripped)
+            return self._write_silence(output_path)
+        if len(stripped) < 3:
+            logger.warning("Very short dialogue text: %r", stripped)
+
         voice_id = voice_id or self.default_voice_id
-        logger.info(f"Generating speech for text: {text[:50]}...")
+        logger.info("Generating speech for text: %s...", text[:50])
 
         try:
-            # Create output directory if needed (only if path contains a directory)
-            output_dir = os.path.dirname(output_path)
-            if output_dir:
-                os.makedirs(output_dir, exist_ok=True)
-
-            # Generate audio using the elevenlabs 0.2.27 API
-            audio = generate(
-                text=text,
-                voice=voice_id,
-                model=model
+            # Identical inputs produce identical audio, so reuse earlier output
+            key = cache_key(model, voice_id, stability, similarity_boost, text)
+            return get_or_compute(
+                "tts",
+                key,
+                lambda path: self._synthesize(
+                    text, path, voice_id, model, stability, similarity_boost,
+                    optimize_streaming_latency
+                ),
+                output_path
             )
 
-            # Save to file
-            save(audio, output_path)
-
-            logger.info(f"Generated speech saved to {output_path}")
-            return output_path
-
         except Exception as e:
-            logger.error(f"Error generating speech: {str(e)}")
+            logger.error("Error generating speech: %s", e)
             raise
 
+    def _synthesize(
+        self,
+        text: str,
+        output_path: str,
+        voice_id: str,
+        model: str,
+        stability: float,
+        similarity_boost: float,
+        optimize_streaming_latency: int = 0
+    ) -> str:
+        """Call the ElevenLabs API and stream the audio to output_path"""
+        ensure_parent_dir(output_path)
+
+        # Generate audio using the elevenlabs 0.2.27 streaming API, so chunks
+        # are written as they arrive instead of buffering the whole MP3
+        audio_stream = generate(
+            text=text,
+            voice=self._get_voice(voice_id, stability, similarity_boost),
+            model=model,
+            stream=True,
+            latency=optimize_streaming_latency
+        )
+
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in audio_stream:
+                if chunk:
+                    f.write(chunk)
+
+        logger.info("Generated speech saved to %s", output_path)
+        return output_path
+
+    def _write_silence(self, output_path: str) -> str:
+        """Write a short silent MP3 without calling the API"""
+        ensure_parent_dir(output_path)
+
+        # Replace rather than overwrite: the old file may be a cache hard link
+        tmp_path = f"{output_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_SILENT_MP3)
+        os.replace(tmp_path, output_path)
+        return output_path
+
+    def _get_voice(self, voice_id: str, stability: float, similarity_boost: float) -> Voice:
+        """
+        Get a reusable Voice with the given settings
+
+        Passing a Voice instead of a bare ID stops the SDK from fetching the
+        voice from the API before every generation.
+        """
+        key = (voice_id, stability, similarity_boost)
+        voice = self._voice_cache.get(key)
+        if voice is None:
+            voice = Voice(
+                voice_id=voice_id,
+                settings=VoiceSettings(
+                    stability=stability,
+                    similarity_boost=similarity_boost
+                )
+            )
+            self._voice_cache[key] = voice
+        return voice
+
     def list_voices(self) -> list:
         """
         List available voices
@@ -102,7 +180,7 @@ class TTSClient:
             voice_list = voices()
             return voice_list
         except Exception as e:
-            logger.error(f"Error listing voices: {str(e)}")
+            logger.error("Error listing voices: %s", e)
             raise
 
     def get_voice_info(self, voice_id: str) -> dict:
@@ -127,5 +205,5 @@ class TTSClient:
                     }
             raise ValueError(f"Voice ID '{voice_id}' not found")
         except Exception as e:
-            logger.error(f"Error getting voice info: {str(e)}")
+            logger.error("Error getting voice info: %s", e)
             raise
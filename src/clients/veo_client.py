@@ -3,12 +3,87 @@ Google Veo API Client for video generation using google-genai SDK
 """
 import os
 import time
+import functools
+import uuid
+from dataclasses import dataclass
 import logging
-from typing import Optional, Dict, Any
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Optional, Dict, Any, List
 from pathlib import Path
 
+from src.utils.gcs import generate_signed_url, parse_gcs_uri
+from src.utils.polling import PollScheduler
+
 logger = logging.getLogger(__name__)
 
+try:
+    from google import genai
+    from google.genai import types
+except ImportError:
+    genai = None
+    types = None
+
+# genai clients keyed by (project_id, location, credentials path)
+_CLIENT_CACHE: Dict[tuple, Any] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _resolve_path(path: str) -> str:
+    """Resolve a credentials path relative to the working directory"""
+    resolved = Path(path)
+    if not resolved.is_absolute():
+        resolved = Path.cwd() / resolved
+    return str(resolved)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_service_account_credentials(creds_path: str):
+    """Load service account credentials once per key file"""
+    from google.oauth2 import service_account
+    return service_account.Credentials.from_service_account_file(creds_path)
+
+
+@dataclass
+class VeoJob:
+    """State of one Veo generation job"""
+
+    __slots__ = (
+        "operation", "prompt", "duration", "aspect_ratio", "created_at",
+        "output_gcs_uri", "video", "video_gcs_uri",
+    )
+
+    operation: Any  # Latest fetched long-running operation
+    prompt: str
+    duration: int
+    aspect_ratio: str
+    created_at: float
+    output_gcs_uri: Optional[str]  # GCS prefix Veo writes to, if configured
+    video: Any  # Resolved generated video handle, once done
+    video_gcs_uri: Optional[str]  # GCS object of the downloaded video
+
+
+def _get_genai_client(project_id: Optional[str], location: str, creds_path: Optional[str]):
+    """
+    Get a Vertex AI genai client, shared by every VeoClient with the same config
+
+    Building a client runs google.auth.default() and a token refresh, so
+    constructing VeoClient repeatedly (batch runs, CLI commands) reuses the
+    first client instead.
+    """
+    key = (project_id, location, creds_path)
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            # Create Vertex AI client (not API key based)
+            client = genai.Client(
+                vertexai=True,
+                project=project_id,
+                location=location
+            )
+            _CLIENT_CACHE[key] = client
+        return client
+
 
 class VeoClient:
     """Client for Google Veo video generation API"""
@@ -36,30 +111,27 @@ class VeoClient:
         creds_path = credentials_path or os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
         if creds_path:
             # Resolve relative paths
-            creds_path = Path(creds_path)
-            if not creds_path.is_absolute():
-                creds_path = Path.cwd() / creds_path
+            creds_path = _resolve_path(creds_path)
 
             # Set environment variable for google-genai to use
-            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = str(creds_path)
+            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = creds_path
 
-        # Import and initialize the client
-        from google import genai
-        from google.genai import types
+        if genai is None:
+            raise ImportError("google-genai is required for Veo. Install with: pip install google-genai")
 
-        # Create Vertex AI client (not API key based)
-        self.client = genai.Client(
-            vertexai=True,
-            project=self.project_id,
-            location=self.location
-        )
+        self.client = _get_genai_client(self.project_id, self.location, creds_path)
         self.types = types
 
-        # Store operations by job_id for tracking
-        self.operations = {}
-        self.job_data = {}  # Store job metadata including GCS URIs
+        # GCS client for downloading outputs, created on first use
+        self._storage_client = None
 
-        logger.info(f"Initialized Veo client for project {self.project_id} in {self.location}")
+        # Track jobs (operation, settings, GCS locations) by job_id
+        self.jobs: Dict[str, VeoJob] = {}
+
+        # One scheduler thread refreshes every in-flight operation
+        self._poller = PollScheduler(self._poll_job, name="veo-poller")
+
+        logger.info("Initialized Veo client for project %s in %s", self.project_id, self.location)
 
     def generate_video(
         self,
@@ -89,13 +161,13 @@ class VeoClient:
             Dictionary containing job_id, operation, and other metadata
         """
         if input_image:
-            logger.info(f"Generating video from image: {input_image}")
-            logger.info(f"Prompt: {prompt[:100]}...")
+            logger.info("Generating video from image: %s", input_image)
+            logger.info("Prompt: %s...", prompt[:100])
         elif input_video:
-            logger.info(f"Extending video from: {input_video}")
-            logger.info(f"Extension prompt: {prompt[:100]}...")
+            logger.info("Extending video from: %s", input_video)
+            logger.info("Extension prompt: %s...", prompt[:100])
         else:
-            logger.info(f"Generating video with prompt: {prompt[:100]}...")
+            logger.info("Generating video with prompt: %s...", prompt[:100])
 
         try:
             # Prepare configuration
@@ -109,9 +181,9 @@ class VeoClient:
             if self.output_bucket:
                 # Create a unique output path for this video
                 import time
-                output_path = f"{self.output_bucket}/veo_output_{int(time.time())}.mp4"
+                output_path = f"{self.output_bucket}/veo_output_{int(time.time())}_{uuid.uuid4().hex[:8]}.mp4"
                 config_params["output_gcs_uri"] = output_path
-                logger.info(f"Output will be saved to: {output_path}")
+                logger.info("Output will be saved to: %s", output_path)
 
             config = self.types.GenerateVideosConfig(**config_params)
 
@@ -121,11 +193,11 @@ class VeoClient:
                 if input_image.startswith("gs://"):
                     # GCS URI
                     image_param = self.types.Image(uri=input_image)
-                    logger.info(f"Using GCS image URI: {input_image}")
+                    logger.info("Using GCS image URI: %s", input_image)
                 else:
                     # Local file
                     image_param = self.types.Image.from_file(location=input_image)
-                    logger.info(f"Loaded image from file: {input_image}")
+                    logger.info("Loaded image from file: %s", input_image)
 
             # Prepare video input if provided (for video extension)
             video_param = None
@@ -133,7 +205,7 @@ class VeoClient:
                 if input_video.startswith("gs://"):
                     # GCS URI
                     video_param = self.types.Video(uri=input_video)
-                    logger.info(f"Using GCS video URI: {input_video}")
+                    logger.info("Using GCS video URI: %s", input_video)
                 else:
                     # Local file - check codec and convert if needed
                     import ffmpeg
@@ -145,11 +217,11 @@ class VeoClient:
                         video_stream = next(s for s in probe['streams'] if s['codec_type'] == 'video')
                         codec = video_stream['codec_name']
 
-                        logger.info(f"Input video codec: {codec}")
+                        logger.info("Input video codec: %s", codec)
 
                         # Veo only supports H264, convert if needed
                         if codec.lower() not in ['h264', 'avc']:
-                            logger.info(f"Converting {codec} to H264 (Veo requires H264)")
+                            logger.info("Converting %s to H264 (Veo requires H264)", codec)
 
                             # Import VideoProcessor for conversion
                             from src.utils.video_processor import VideoProcessor
@@ -162,18 +234,18 @@ class VeoClient:
                             # Convert to H264
                             h264_path = processor.convert_to_h264(input_video, h264_path)
                             input_video = h264_path  # Use converted file
-                            logger.info(f"Converted to H264: {h264_path}")
+                            logger.info("Converted to H264: %s", h264_path)
 
                     except Exception as e:
-                        logger.warning(f"Could not probe video codec: {e}. Proceeding anyway...")
+                        logger.warning("Could not probe video codec: %s. Proceeding anyway...", e)
 
                     # Load video file
                     video_param = self.types.Video.from_file(location=input_video)
-                    logger.info(f"Loaded video from file: {input_video}")
+                    logger.info("Loaded video from file: %s", input_video)
 
             # Generate video
-            logger.info(f"Sending request to Veo API (model: {self.model_name})...")
-            logger.info(f"Duration: {duration}s, Aspect ratio: {aspect_ratio}")
+            logger.info("Sending request to Veo API (model: %s)...", self.model_name)
+            logger.info("Duration: %ss, Aspect ratio: %s", duration, aspect_ratio)
 
             operation = self.client.models.generate_videos(
                 model=self.model_name,
@@ -184,8 +256,18 @@ class VeoClient:
             )
 
             # Create job ID and store operation
-            job_id = f"veo_job_{int(time.time())}"
-            self.operations[job_id] = operation
+            job_id = f"veo_job_{int(time.time())}_{uuid.uuid4().hex[:8]}"
+            job = VeoJob(
+                operation=operation,
+                prompt=prompt,
+                duration=duration,
+                aspect_ratio=aspect_ratio,
+                created_at=time.time(),
+                output_gcs_uri=config_params.get("output_gcs_uri"),  # Store GCS output path
+                video=None,
+                video_gcs_uri=None,
+            )
+            self.jobs[job_id] = job
 
             job_data = {
                 "job_id": job_id,
@@ -193,103 +275,234 @@ class VeoClient:
                 "prompt": prompt,
                 "duration": duration,
                 "aspect_ratio": aspect_ratio,
-                "created_at": time.time(),
+                "created_at": job.created_at,
                 "operation": operation,  # Store the operation object
                 "operation_name": operation.name if hasattr(operation, 'name') else None,
-                "output_gcs_uri": config_params.get("output_gcs_uri"),  # Store GCS output path
+                "output_gcs_uri": job.output_gcs_uri,
             }
-            self.job_data[job_id] = job_data  # Store job metadata
 
-            logger.info(f"Video generation started with job_id: {job_id}")
-            logger.info(f"Operation: {operation.name if hasattr(operation, 'name') else 'N/A'}")
+            logger.info("Video generation started with job_id: %s", job_id)
+            logger.info("Operation: %s", operation.name if hasattr(operation, 'name') else 'N/A')
 
             return job_data
 
         except Exception as e:
-            logger.error(f"Error generating video: {str(e)}")
+            logger.error("Error generating video: %s", e)
             raise
 
     def wait_for_completion(
         self,
         job_id: str,
         timeout: int = 600,
-        poll_interval: int = 20
+        poll_interval: Optional[float] = None,
+        initial_interval: float = 2.0,
+        max_interval: float = 30.0,
+        backoff_factor: float = 1.5
     ) -> Dict[str, Any]:
         """
         Wait for video generation to complete
 
+        Jobs are polled by the client's shared scheduler thread with
+        exponential backoff and jitter, so short jobs are picked up soon
+        after finishing while long jobs are polled less often, and waiting
+        on many jobs costs no sleeping thread per job.
+
         Args:
             job_id: Job identifier from generate_video
             timeout: Maximum wait time in seconds
-            poll_interval: Time between status checks in seconds (recommended: 20s)
+            poll_interval: Fixed time between status checks in seconds
+                          (disables backoff when set)
+            initial_interval: Delay before the first status check in seconds
+            max_interval: Upper bound for the delay between checks in seconds
+            backoff_factor: Growth factor for the delay after each check
 
         Returns:
             Dictionary with job status and video data
         """
-        logger.info(f"Waiting for job {job_id} to complete...")
+        logger.info("Waiting for job %s to complete...", job_id)
 
-        if job_id not in self.operations:
+        if job_id not in self.jobs:
             raise ValueError(f"Job {job_id} not found. Did you call generate_video?")
 
-        operation = self.operations[job_id]
-        start_time = time.time()
+        if poll_interval is not None:
+            initial_interval = max_interval = poll_interval
+            backoff_factor = 1.0
 
-        while time.time() - start_time < timeout:
-            try:
-                # Check if operation is done
-                if operation.done:
-                    # Check for errors first
-                    if hasattr(operation, 'error') and operation.error:
-                        error_msg = operation.error.get('message', str(operation.error))
-                        logger.error(f"Job {job_id} failed: {error_msg}")
-                        raise Exception(f"Video generation failed: {error_msg}")
-
-                    logger.info(f"Job {job_id} completed successfully")
-
-                    # Check if video was saved to GCS (large videos)
-                    if job_id in self.job_data and self.job_data[job_id].get("output_gcs_uri"):
-                        gcs_uri = self.job_data[job_id]["output_gcs_uri"]
-                        logger.info(f"Video saved to GCS: {gcs_uri}")
-                        return {
-                            "job_id": job_id,
-                            "status": "COMPLETED",
-                            "gcs_uri": gcs_uri,  # GCS URI instead of video object
-                            "completed_at": time.time(),
-                            "operation": operation,
-                        }
-
-                    # Extract video data from response (small videos)
-                    if hasattr(operation, 'response') and operation.response:
-                        generated_videos = operation.response.generated_videos
-
-                        if generated_videos and len(generated_videos) > 0:
-                            video = generated_videos[0].video
-
-                            return {
-                                "job_id": job_id,
-                                "status": "COMPLETED",
-                                "video": video,
-                                "completed_at": time.time(),
-                                "operation": operation,
-                            }
-                        else:
-                            raise Exception("No videos were generated in the response")
-                    else:
-                        raise Exception(f"Operation completed but no response available: {operation}")
-
-                # Poll for updates
-                logger.info(f"Job {job_id} still processing... (elapsed: {int(time.time() - start_time)}s)")
-                time.sleep(poll_interval)
-
-                # Refresh operation status
-                operation = self.client.operations.get(operation)
-                self.operations[job_id] = operation
+        future = self._poller.submit(
+            job_id,
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+            backoff_factor=backoff_factor
+        )
+
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            self._poller.cancel(job_id)
+            raise TimeoutError(f"Job {job_id} did not complete within {timeout} seconds")
+        except Exception as e:
+            logger.error("Job %s failed: %s", job_id, e)
+            raise
+
+    def wait_for_many(
+        self,
+        job_ids: List[str],
+        timeout: int = 600,
+        initial_interval: float = 2.0,
+        max_interval: float = 30.0,
+        backoff_factor: float = 1.5
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Wait for several video generation jobs at once
+
+        All jobs are handed to the client's poll scheduler at once, so
+        waiting on N jobs takes about as long as the slowest one.
+
+        Args:
+            job_ids: Job identifiers from generate_video
+            timeout: Maximum wait time in seconds for all jobs
+            initial_interval: Delay before the first status check in seconds
+            max_interval: Upper bound for the delay between checks in seconds
+            backoff_factor: Growth factor for the delay after each round
+
+        Returns:
+            Dictionary mapping job_id to its wait_for_completion result; failed
+            jobs map to {"job_id", "status": "FAILED", "error"} instead of raising
+        """
+        job_ids = list(dict.fromkeys(job_ids))
+        for job_id in job_ids:
+            if job_id not in self.jobs:
+                raise ValueError(f"Job {job_id} not found. Did you call generate_video?")
+
+        logger.info("Waiting for %s jobs to complete...", len(job_ids))
+
+        futures = {
+            job_id: self._poller.submit(
+                job_id,
+                initial_interval=initial_interval,
+                max_interval=max_interval,
+                backoff_factor=backoff_factor
+            )
+            for job_id in job_ids
+        }
 
+        results = {}
+        deadline = time.monotonic() + timeout
+        for job_id, future in futures.items():
+            try:
+                results[job_id] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                pending = [pending_id for pending_id, pending_future in futures.items() if not pending_future.done()]
+                for pending_id in pending:
+                    self._poller.cancel(pending_id)
+                raise TimeoutError(
+                    f"Jobs {', '.join(pending)} did not complete within {timeout} seconds"
+                )
             except Exception as e:
-                logger.error(f"Error checking job status: {str(e)}")
-                raise
+                logger.error("Job %s failed: %s", job_id, e)
+                results[job_id] = {"job_id": job_id, "status": "FAILED", "error": str(e)}
+
+        return results
+
+    def _poll_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Check a job once for the poll scheduler
+
+        Returns:
+            wait_for_completion result when done, None while still processing
+        """
+        operation = self.jobs[job_id].operation
+
+        # Finished operations never change, so only refresh unfinished ones
+        if not operation.done:
+            operation = self.client.operations.get(operation)
+            self.jobs[job_id].operation = operation
+
+        if not operation.done:
+            logger.debug("Job %s still processing", job_id)
+            return None
+
+        error_msg = self._operation_error(operation)
+        if error_msg:
+            raise Exception(f"Video generation failed: {error_msg}")
+
+        return self._completed_job(job_id, operation, getattr(operation, 'response', None))
+
+    @staticmethod
+    def _operation_error(operation) -> Optional[str]:
+        """Return the error message of a failed operation, or None"""
+        if hasattr(operation, 'error') and operation.error:
+            return operation.error.get('message', str(operation.error))
+        return None
+
+    def _completed_job(self, job_id: str, operation, response) -> Dict[str, Any]:
+        """
+        Build the wait_for_completion result for a finished operation
+
+        Args:
+            job_id: Job identifier
+            operation: Finished operation
+            response: Operation response holding the generated videos
+
+        Returns:
+            Dictionary with job status and video data
+        """
+        logger.info("Job %s completed successfully", job_id)
+
+        # Check if video was saved to GCS (large videos)
+        gcs_uri = self.jobs[job_id].output_gcs_uri
+        if gcs_uri:
+            logger.info("Video saved to GCS: %s", gcs_uri)
+            return {
+                "job_id": job_id,
+                "status": "COMPLETED",
+                "gcs_uri": gcs_uri,  # GCS URI instead of video object
+                "completed_at": time.time(),
+                "operation": operation,
+            }
+
+        # Extract video data from response (small videos)
+        if not response:
+            raise Exception(f"Operation completed but no response available: {operation}")
+
+        video = self._resolve_video(job_id, response)
+        if video is None:
+            raise Exception("No videos were generated in the response")
+
+        return {
+            "job_id": job_id,
+            "status": "COMPLETED",
+            "video": video,
+            "completed_at": time.time(),
+            "operation": operation,
+        }
+
+    def _resolve_video(self, job_id: str, response=None):
+        """
+        Get the first generated video of a finished job
 
-        raise TimeoutError(f"Job {job_id} did not complete within {timeout} seconds")
+        The handle is resolved from the operation response once and kept on
+        the job, so later lookups skip the response walk.
+
+        Args:
+            job_id: Job identifier
+            response: Operation response (defaults to the stored operation's)
+
+        Returns:
+            Video object, or None if the response holds no videos
+        """
+        job = self.jobs[job_id]
+        if job.video is not None:
+            return job.video
+
+        if response is None:
+            response = getattr(job.operation, 'response', None)
+        generated_videos = response.generated_videos if response else None
+        if not generated_videos:
+            return None
+
+        job.video = generated_videos[0].video
+        return job.video
 
     def _check_job_status(self, job_id: str) -> Dict[str, Any]:
         """
@@ -301,15 +514,36 @@ class VeoClient:
         Returns:
             Dictionary with job status information
         """
-        if job_id not in self.operations:
+        if job_id not in self.jobs:
             raise ValueError(f"Job {job_id} not found")
 
-        operation = self.operations[job_id]
+        operation = self.jobs[job_id].operation
+
+        # Finished operations never change, so only refresh unfinished ones
+        if not operation.done:
+            operation = self.client.operations.get(operation)
+            self.jobs[job_id].operation = operation
+
+        return self._status_from_operation(job_id, operation)
+
+    def _peek_status(self, job_id: str) -> Dict[str, Any]:
+        """
+        Report a job's status from the last fetched operation, without an API call
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Dictionary with job status information
+        """
+        if job_id not in self.jobs:
+            raise ValueError(f"Job {job_id} not found")
 
-        # Refresh operation
-        operation = self.client.operations.get(operation)
-        self.operations[job_id] = operation
+        return self._status_from_operation(job_id, self.jobs[job_id].operation)
 
+    @staticmethod
+    def _status_from_operation(job_id: str, operation) -> Dict[str, Any]:
+        """Build the status dictionary for an operation"""
         status = "COMPLETED" if operation.done else "PROCESSING"
 
         return {
@@ -318,6 +552,22 @@ class VeoClient:
             "operation": operation,
         }
 
+    def _get_storage_client(self):
+        """Get the GCS client, creating it on first use"""
+        if self._storage_client is None:
+            from google.cloud import storage
+
+            creds_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+            credentials = None
+            if creds_path:
+                credentials = _load_service_account_credentials(_resolve_path(creds_path))
+
+            self._storage_client = storage.Client(
+                project=self.project_id,
+                credentials=credentials
+            )
+        return self._storage_client
+
     def get_video_url(self, job_id: str) -> Optional[str]:
         """
         Get download URL for generated video
@@ -328,22 +578,47 @@ class VeoClient:
         Returns:
             URL to download the video, or None if using video object directly
         """
-        status = self._check_job_status(job_id)
+        # wait_for_completion usually left a finished operation behind
+        status = self._peek_status(job_id)
+        if status["status"] != "COMPLETED":
+            status = self._check_job_status(job_id)
 
         if status["status"] != "COMPLETED":
             raise Exception(f"Video not ready. Status: {status['status']}")
 
-        operation = status["operation"]
+        # Video object might have a URI
+        return getattr(self._resolve_video(job_id), 'uri', None)
+
+    def get_video_gcs_uri(self, job_id: str) -> Optional[str]:
+        """
+        Get the GCS object of a job's video once save_video has located it
 
-        if hasattr(operation, 'response') and operation.response:
-            generated_videos = operation.response.generated_videos
-            if generated_videos and len(generated_videos) > 0:
-                video = generated_videos[0].video
-                # Video object might have a URI
-                if hasattr(video, 'uri'):
-                    return video.uri
+        Args:
+            job_id: Job identifier
 
-        return None
+        Returns:
+            gs:// URI, or None if the video wasn't written to GCS
+        """
+        job = self.jobs.get(job_id)
+        return job.video_gcs_uri if job else None
+
+    def get_video_signed_url(self, job_id: str, expiration: int = 3600) -> Optional[str]:
+        """
+        Get a signed URL for a job's video in GCS, for services to fetch it
+
+        Signs with the same service-account storage client save_video uses.
+
+        Args:
+            job_id: Job identifier
+            expiration: URL lifetime in seconds
+
+        Returns:
+            HTTPS URL, or None if the video wasn't written to GCS
+        """
+        gcs_uri = self.get_video_gcs_uri(job_id)
+        if not gcs_uri:
+            return None
+        return generate_signed_url(gcs_uri, expiration, storage_client=self._get_storage_client())
 
     def save_video(self, job_id: str, output_path: str) -> str:
         """
@@ -356,56 +631,28 @@ class VeoClient:
         Returns:
             Path to the saved video file
         """
-        logger.info(f"Saving video from job {job_id} to {output_path}")
-
-        if job_id not in self.operations:
-            raise ValueError(f"Job {job_id} not found")
+        logger.info("Saving video from job %s to %s", job_id, output_path)
 
-        operation = self.operations[job_id]
+        status = self._peek_status(job_id)
 
-        if not operation.done:
+        if status["status"] != "COMPLETED":
             raise Exception(f"Video generation not complete yet. Call wait_for_completion first.")
 
         # Check if video was saved to GCS
-        if job_id in self.job_data and self.job_data[job_id].get("output_gcs_uri"):
-            gcs_uri = self.job_data[job_id]["output_gcs_uri"]
-            logger.info(f"Downloading video from GCS: {gcs_uri}")
+        gcs_uri = self.jobs[job_id].output_gcs_uri
+        if gcs_uri:
+            logger.info("Downloading video from GCS: %s", gcs_uri)
 
             # Download from GCS using google-cloud-storage
-            from google.cloud import storage
-            from google.oauth2 import service_account
-
             # Parse GCS URI
-            if not gcs_uri.startswith("gs://"):
-                raise ValueError(f"Invalid GCS URI: {gcs_uri}")
-
-            # Remove gs:// prefix and split bucket/path
-            path_parts = gcs_uri[5:].split("/", 1)
-            bucket_name = path_parts[0]
-            base_path = path_parts[1] if len(path_parts) > 1 else ""
-
-            # Set up credentials
-            creds_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-            if creds_path:
-                creds_path = Path(creds_path)
-                if not creds_path.is_absolute():
-                    creds_path = Path.cwd() / creds_path
-                credentials = service_account.Credentials.from_service_account_file(
-                    str(creds_path)
-                )
-            else:
-                credentials = None
+            bucket_name, base_path = parse_gcs_uri(gcs_uri)
 
             # Download from GCS
-            storage_client = storage.Client(
-                project=self.project_id,
-                credentials=credentials
-            )
-            bucket = storage_client.bucket(bucket_name)
+            bucket = self._get_storage_client().bucket(bucket_name)
 
             # Veo saves videos in a nested structure: base_path/operation_id/sample_0.mp4
             # Find the actual video file by listing blobs with prefix
-            logger.info(f"Searching for video in GCS prefix: {base_path}/")
+            logger.info("Searching for video in GCS prefix: %s/", base_path)
             blobs = list(bucket.list_blobs(prefix=base_path + "/"))
 
             if not blobs:
@@ -421,25 +668,24 @@ class VeoClient:
             if not video_blob:
                 raise Exception(f"No .mp4 file found in GCS at {gcs_uri}")
 
-            logger.info(f"Found video: gs://{bucket_name}/{video_blob.name}")
+            video_gcs_uri = f"gs://{bucket_name}/{video_blob.name}"
+            logger.info("Found video: %s", video_gcs_uri)
             video_blob.download_to_filename(output_path)
 
-            logger.info(f"Video downloaded from GCS to {output_path}")
+            # Keep the object URI so later steps can hand it to other
+            # services instead of re-uploading the local copy
+            self.jobs[job_id].video_gcs_uri = video_gcs_uri
+
+            logger.info("Video downloaded from GCS to %s", output_path)
             return output_path
 
         # Handle video in response (small videos)
-        if hasattr(operation, 'response') and operation.response:
-            generated_videos = operation.response.generated_videos
+        video = self._resolve_video(job_id)
+        if video is None:
+            raise Exception("No videos in operation response")
 
-            if generated_videos and len(generated_videos) > 0:
-                video = generated_videos[0].video
+        # Save video using the SDK's save method
+        video.save(output_path)
+        logger.info("Video saved to %s", output_path)
 
-                # Save video using the SDK's save method
-                video.save(output_path)
-                logger.info(f"Video saved to {output_path}")
-
-                return output_path
-            else:
-                raise Exception("No videos in response")
-        else:
-            raise Exception("Operation has no response")
+        return output_path
@@ -2,13 +2,57 @@
 YouTube video downloading client using yt-dlp
 """
 import os
+import copy
+import glob
+import functools
 import logging
+import threading
 from pathlib import Path
-from typing import Optional
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Optional, Iterator, List, Tuple
 import yt_dlp
 
+from src.utils.pool import get_shared_pool
+
 logger = logging.getLogger(__name__)
 
+# yt-dlp format selectors for the quality presets
+_FORMAT_SELECTORS = {
+    'best': 'bestvideo+bestaudio/best',
+    '1080p': 'bestvideo[height<=1080]+bestaudio/best[height<=1080]',
+    '720p': 'bestvideo[height<=720]+bestaudio/best[height<=720]',
+    '480p': 'bestvideo[height<=480]+bestaudio/best[height<=480]',
+    'worst': 'worstvideo+worstaudio/worst',
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _extract(url: str) -> dict:
+    """
+    Extract (and cache) yt-dlp's info dict for a URL without downloading
+
+    Stream URLs in the info expire after a few hours, which is fine for the
+    CLI's short-lived processes.
+    """
+    ydl_opts = {
+        'quiet': True,
+        'no_warnings': True,
+        'extract_flat': False,
+    }
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        return ydl.extract_info(url, download=False)
+
+
+# Extensions yt-dlp may produce for a video download, in order of preference
+_VIDEO_EXTS = ('.mp4', '.webm', '.mkv', '.mov')
+
+
+def _format_selector(quality: str, max_height: Optional[int] = None) -> str:
+    """Resolve a quality preset (or explicit max height) to a format selector"""
+    if max_height:
+        return f'bestvideo[height<={max_height}]+bestaudio/best[height<={max_height}]'
+    return _FORMAT_SELECTORS.get(quality, _FORMAT_SELECTORS['best'])
+
 
 class YouTubeClient:
     """Client for downloading videos from YouTube using yt-dlp"""
@@ -32,29 +76,22 @@ class YouTubeClient:
         Returns:
             Dictionary with video metadata
         """
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': False,
-        }
-
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                return {
-                    'id': info.get('id'),
-                    'title': info.get('title'),
-                    'duration': info.get('duration'),
-                    'description': info.get('description'),
-                    'uploader': info.get('uploader'),
-                    'view_count': info.get('view_count'),
-                    'width': info.get('width'),
-                    'height': info.get('height'),
-                    'fps': info.get('fps'),
-                    'thumbnail': info.get('thumbnail'),
-                }
+            info = _extract(url)
+            return {
+                'id': info.get('id'),
+                'title': info.get('title'),
+                'duration': info.get('duration'),
+                'description': info.get('description'),
+                'uploader': info.get('uploader'),
+                'view_count': info.get('view_count'),
+                'width': info.get('width'),
+                'height': info.get('height'),
+                'fps': info.get('fps'),
+                'thumbnail': info.get('thumbnail'),
+            }
         except Exception as e:
-            logger.error(f"Error getting video info: {str(e)}")
+            logger.error("Error getting video info: %s", e)
             raise
 
     def download_video(
@@ -63,6 +100,7 @@ class YouTubeClient:
         output_path: str,
         quality: str = "best",
         max_height: Optional[int] = None,
+        info: Optional[dict] = None,
     ) -> str:
         """
         Download video from YouTube
@@ -72,36 +110,122 @@ class YouTubeClient:
             output_path: Full path for output file (without extension)
             quality: Quality preset ('best', '1080p', '720p', '480p', 'worst')
             max_height: Maximum video height (e.g., 1080, 720)
+            info: Raw yt-dlp info dict for the URL (defaults to the cached
+                  extraction, so a preceding get_video_info isn't repeated)
 
         Returns:
             Path to downloaded file
         """
-        logger.info(f"Downloading video from YouTube: {url}")
+        logger.info("Downloading video from YouTube: %s", url)
 
         # Create output directory
         output_dir = os.path.dirname(output_path)
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
 
-        # Build format selector based on quality
-        if max_height:
-            format_selector = f'bestvideo[height<={max_height}]+bestaudio/best[height<={max_height}]'
-        elif quality == 'best':
-            format_selector = 'bestvideo+bestaudio/best'
-        elif quality == '1080p':
-            format_selector = 'bestvideo[height<=1080]+bestaudio/best[height<=1080]'
-        elif quality == '720p':
-            format_selector = 'bestvideo[height<=720]+bestaudio/best[height<=720]'
-        elif quality == '480p':
-            format_selector = 'bestvideo[height<=480]+bestaudio/best[height<=480]'
-        elif quality == 'worst':
-            format_selector = 'worstvideo+worstaudio/worst'
-        else:
-            format_selector = 'bestvideo+bestaudio/best'
+        ydl_opts = self._video_opts(output_path, _format_selector(quality, max_height))
 
-        ydl_opts = {
+        try:
+            # Reuse the extracted info instead of extracting again; yt-dlp
+            # mutates it while processing, so work on a copy
+            info = copy.deepcopy(info if info is not None else _extract(url))
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                ydl.process_ie_result(info, download=True)
+
+            return self._find_download(output_path)
+
+        except Exception as e:
+            logger.error("Error downloading video: %s", e)
+            raise
+
+    def download_many(
+        self,
+        urls: List[str],
+        output_dir: str,
+        quality: str = "best",
+        max_height: Optional[int] = None,
+        max_workers: int = 4,
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Download several videos concurrently
+
+        Downloads run on the shared worker pool, at most max_workers at a
+        time. YoutubeDL instances are not thread-safe, so each worker thread
+        creates its own and reuses it for every URL it handles. Files are
+        named after the video ID.
+
+        Args:
+            urls: YouTube URLs
+            output_dir: Directory for the downloaded files
+            quality: Quality preset ('best', '1080p', '720p', '480p', 'worst')
+            max_height: Maximum video height (e.g., 1080, 720)
+            max_workers: Maximum number of simultaneous downloads
+
+        Yields:
+            (url, downloaded file path) tuples in completion order
+        """
+        logger.info("Downloading %s videos from YouTube to %s", len(urls), output_dir)
+
+        os.makedirs(output_dir, exist_ok=True)
+
+        ydl_opts = self._video_opts(
+            os.path.join(output_dir, '%(id)s'),
+            _format_selector(quality, max_height)
+        )
+
+        local = threading.local()
+        instances = []
+        instances_lock = threading.Lock()
+
+        def download(url: str) -> str:
+            ydl = getattr(local, 'ydl', None)
+            if ydl is None:
+                ydl = yt_dlp.YoutubeDL(ydl_opts)
+                local.ydl = ydl
+                with instances_lock:
+                    instances.append(ydl)
+
+            info = ydl.extract_info(url, download=True)
+            return self._find_download(os.path.join(output_dir, info['id']))
+
+        remaining = iter(urls)
+        in_flight = {}
+
+        def submit_next():
+            url = next(remaining, None)
+            if url is not None:
+                # Look the pool up each time: set_max_workers may have
+                # replaced (and shut down) the one this batch started on
+                in_flight[get_shared_pool().submit(download, url)] = url
+
+        try:
+            # Keep at most max_workers downloads on the shared pool at once
+            for _ in range(max(1, max_workers)):
+                submit_next()
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url = in_flight.pop(future)
+                    try:
+                        path = future.result()
+                    except Exception as e:
+                        logger.error("Error downloading video %s: %s", url, e)
+                        raise
+                    submit_next()
+                    yield url, path
+        finally:
+            for future in in_flight:
+                future.cancel()
+            wait(in_flight)
+            for ydl in instances:
+                ydl.close()
+
+    def _video_opts(self, outtmpl: str, format_selector: str) -> dict:
+        """Build yt-dlp options for a video download"""
+        return {
             'format': format_selector,
-            'outtmpl': output_path,
+            'outtmpl': outtmpl,
             'merge_output_format': self.output_format,
             'quiet': False,
             'no_warnings': False,
@@ -112,34 +236,30 @@ class YouTubeClient:
             }],
         }
 
-        try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
+    def _find_download(self, output_path: str) -> str:
+        """Find the file yt-dlp wrote for an output path (it adds the extension)"""
+        output_base = Path(output_path)
 
-            # Find the actual output file (yt-dlp adds extension)
-            final_path = f"{output_path}.{self.output_format}"
-            if os.path.exists(final_path):
-                logger.info(f"Downloaded video to {final_path}")
-                return final_path
-
-            # Check if file exists without double extension
-            if os.path.exists(output_path):
-                logger.info(f"Downloaded video to {output_path}")
-                return output_path
+        # One directory listing instead of a stat per candidate extension;
+        # only exact "<name>.<ext>" matches count (not .part or .fNNN files)
+        candidates = {
+            match.suffix: match
+            for match in output_base.parent.glob(f"{glob.escape(output_base.name)}.*")
+            if match.name == output_base.name + match.suffix
+        }
 
-            # Look for any file with the base name
-            output_base = Path(output_path)
-            for ext in ['mp4', 'webm', 'mkv', 'mov']:
-                check_path = str(output_base.parent / f"{output_base.name}.{ext}")
-                if os.path.exists(check_path):
-                    logger.info(f"Downloaded video to {check_path}")
-                    return check_path
+        for ext in (f".{self.output_format}", *_VIDEO_EXTS):
+            if ext in candidates:
+                final_path = str(candidates[ext])
+                logger.info("Downloaded video to %s", final_path)
+                return final_path
 
-            raise FileNotFoundError(f"Downloaded file not found at expected path: {output_path}")
+        # Check if file exists without double extension
+        if os.path.exists(output_path):
+            logger.info("Downloaded video to %s", output_path)
+            return output_path
 
-        except Exception as e:
-            logger.error(f"Error downloading video: {str(e)}")
-            raise
+        raise FileNotFoundError(f"Downloaded file not found at expected path: {output_path}")
 
     def download_audio(
         self,
@@ -158,7 +278,7 @@ class YouTubeClient:
         Returns:
             Path to downloaded audio file
         """
-        logger.info(f"Downloading audio from YouTube: {url}")
+        logger.info("Downloading audio from YouTube: %s", url)
 
         output_dir = os.path.dirname(output_path)
         if output_dir:
@@ -183,20 +303,23 @@ class YouTubeClient:
 
             final_path = f"{output_path}.{audio_format}"
             if os.path.exists(final_path):
-                logger.info(f"Downloaded audio to {final_path}")
+                logger.info("Downloaded audio to %s", final_path)
                 return final_path
 
             raise FileNotFoundError(f"Downloaded audio file not found: {final_path}")
 
         except Exception as e:
-            logger.error(f"Error downloading audio: {str(e)}")
+            logger.error("Error downloading audio: %s", e)
             raise
 
     def _progress_hook(self, d: dict):
         """Progress callback for download status"""
         if d['status'] == 'downloading':
+            # Called once per downloaded block; skip the work unless it is logged
+            if not logger.isEnabledFor(logging.DEBUG):
+                return
             percent = d.get('_percent_str', 'N/A')
             speed = d.get('_speed_str', 'N/A')
-            logger.debug(f"Download progress: {percent} at {speed}")
+            logger.debug("Download progress: %s at %s", percent, speed)
         elif d['status'] == 'finished':
             logger.info("Download finished, processing...")
@@ -1,3 +1,3 @@
-from .prompt import VideoPrompt, SceneConfig
+from .prompt import VideoPrompt, SceneConfig, BatchConfig
 
-__all__ = ['VideoPrompt', 'SceneConfig']
+__all__ = ['VideoPrompt', 'SceneConfig', 'BatchConfig']
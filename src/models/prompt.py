@@ -1,13 +1,23 @@
 """
 Prompt models for video generation
 """
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, List
 
+# (label, field) pairs appended to the Veo prompt when the field is set
+_LABELED_FIELDS = (
+    ("Character", "character_consistency"),
+    ("Camera", "camera_movement"),
+    ("Lighting", "lighting_style"),
+    ("Performance", "emotion_performance"),
+)
 
 class VideoPrompt(BaseModel):
     """Structured video generation prompt"""
 
+    # Prompts are values: immutable once built, hashable, safe to share
+    model_config = ConfigDict(frozen=True)
+
     cinematic_description: str = Field(
         ...,
         description="Main visual description of the scene"
@@ -35,18 +45,14 @@ class VideoPrompt(BaseModel):
 
     def to_veo_prompt(self) -> str:
         """Convert structured prompt to single string for Veo API"""
-        parts = [self.cinematic_description]
-
-        if self.character_consistency:
-            parts.append(f"Character: {self.character_consistency}")
-        if self.camera_movement:
-            parts.append(f"Camera: {self.camera_movement}")
-        if self.lighting_style:
-            parts.append(f"Lighting: {self.lighting_style}")
-        if self.emotion_performance:
-            parts.append(f"Performance: {self.emotion_performance}")
-
-        return ". ".join(parts)
+        return ". ".join([
+            self.cinematic_description,
+            *(
+                f"{label}: {value}"
+                for label, field in _LABELED_FIELDS
+                if (value := getattr(self, field))
+            ),
+        ])
 
     def get_dialogue(self) -> str:
         """Get dialogue text for TTS"""
@@ -56,6 +62,14 @@ class VideoPrompt(BaseModel):
 class SceneConfig(BaseModel):
     """Configuration for a scene"""
 
+    model_config = ConfigDict(frozen=True)
+
     scene_id: str = Field(..., description="Scene identifier (e.g., scene_01)")
     prompt: VideoPrompt
     output_dir: Optional[str] = Field(None, description="Custom output directory")
+
+
+class BatchConfig(BaseModel):
+    """Batch config file with scene definitions"""
+
+    scenes: List[SceneConfig] = Field(default_factory=list, description="Scenes to process")
@@ -1,4 +1,10 @@
-from .video_processor import VideoProcessor
-from .scene_manager import SceneManager
+from src.utils.lazy import lazy_exports
+
+# video_processor imports ffmpeg-python (and requests), so exports are only
+# imported when first accessed
+__getattr__ = lazy_exports(__name__, {
+    'VideoProcessor': '.video_processor',
+    'SceneManager': '.scene_manager',
+})
 
 __all__ = ['VideoProcessor', 'SceneManager']
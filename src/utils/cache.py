@@ -0,0 +1,145 @@
+"""
+Content-addressed cache for outputs of paid APIs (TTS, lip-sync)
+"""
+import os
+import shutil
+import hashlib
+import logging
+import threading
+from typing import Callable, Optional
+
+from src.utils.fs import ensure_parent_dir
+
+logger = logging.getLogger(__name__)
+
+_stats = {"hits": 0, "misses": 0}
+_stats_lock = threading.Lock()
+
+
+def cache_key(*parts) -> str:
+    """
+    Build a cache key from the inputs that determine an output
+
+    Args:
+        *parts: Values identifying the output (model, voice, text, hashes...)
+
+    Returns:
+        Hex SHA-256 digest of the joined parts
+    """
+    return hashlib.sha256("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+
+def hash_file(file_path: str) -> str:
+    """
+    Hash a file's contents without reading it into memory
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Hex SHA-256 digest of the file
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def get_cache_dir() -> Optional[str]:
+    """
+    Return the cache root, or None when caching is disabled (API_CACHE_DIR='')
+
+    Defaults to veo-fcp under the user cache directory ($XDG_CACHE_HOME or
+    ~/.cache), so cached renders never land in the working tree.
+    """
+    cache_dir = os.getenv("API_CACHE_DIR")
+    if cache_dir is None:
+        user_cache = os.getenv("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+        cache_dir = os.path.join(user_cache, "veo-fcp")
+    return os.path.expanduser(cache_dir) if cache_dir else None
+
+
+def get_or_compute(
+    namespace: str,
+    key: str,
+    produce_fn: Callable[[str], str],
+    output_path: str
+) -> str:
+    """
+    Materialize a cached output at output_path, producing it on a miss
+
+    Hits are hard-linked (or copied across filesystems) from the cache, so a
+    repeat run skips the API call entirely. On a miss produce_fn writes
+    output_path and the result is stored under the key.
+
+    Args:
+        namespace: Cache subdirectory (e.g. "tts", "lipsync")
+        key: Key from cache_key
+        produce_fn: Called with output_path to create the output on a miss
+        output_path: Where the output should end up
+
+    Returns:
+        output_path
+    """
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return produce_fn(output_path)
+
+    extension = os.path.splitext(output_path)[1]
+    cached_path = os.path.join(cache_dir, namespace, f"{key}{extension}")
+
+    # Outputs may be hard links into the cache; unlink instead of
+    # overwriting in place so a cached entry is never truncated
+    _remove(output_path)
+
+    if os.path.exists(cached_path):
+        ensure_parent_dir(output_path)
+        _link_or_copy(cached_path, output_path)
+        _record("hits")
+        logger.info("Cache hit (%s): %s -> %s [%s]", namespace, key[:12], output_path, _summary())
+        return output_path
+
+    _record("misses")
+    logger.info("Cache miss (%s): %s [%s]", namespace, key[:12], _summary())
+
+    result_path = produce_fn(output_path)
+
+    try:
+        ensure_parent_dir(cached_path)
+        tmp_path = f"{cached_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        _link_or_copy(result_path, tmp_path)
+        os.replace(tmp_path, cached_path)
+    except OSError as e:
+        # A failed cache write only costs a future API call
+        logger.warning("Could not cache %s: %s", result_path, e)
+
+    return result_path
+
+
+def _link_or_copy(src: str, dst: str):
+    """Hard-link src to dst, copying when linking isn't possible"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _remove(file_path: str):
+    """Delete a file if it exists"""
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        pass
+
+
+def _record(counter: str):
+    """Increment a hit/miss counter"""
+    with _stats_lock:
+        _stats[counter] += 1
+
+
+def _summary() -> str:
+    """Format the hit/miss counters for logging"""
+    with _stats_lock:
+        return f"hits={_stats['hits']} misses={_stats['misses']}"
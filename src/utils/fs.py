@@ -0,0 +1,33 @@
+"""
+Filesystem helpers
+"""
+import os
+
+# Directories this process has already created (or found existing)
+_created_dirs = set()
+
+
+def ensure_dir(path: str):
+    """
+    Create a directory and its parents, at most once per process
+
+    Repeated calls for the same path skip the makedirs syscalls. A directory
+    removed after it was first ensured is not recreated.
+
+    Args:
+        path: Directory path (empty means the working directory)
+    """
+    if not path or path in _created_dirs:
+        return
+    os.makedirs(path, exist_ok=True)
+    _created_dirs.add(path)
+
+
+def ensure_parent_dir(file_path: str):
+    """
+    Make sure the directory that will hold file_path exists
+
+    Args:
+        file_path: Path of a file about to be written
+    """
+    ensure_dir(os.path.dirname(file_path))
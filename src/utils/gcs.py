@@ -0,0 +1,59 @@
+"""
+Google Cloud Storage helpers
+"""
+import os
+import logging
+from datetime import timedelta
+
+logger = logging.getLogger(__name__)
+
+
+def parse_gcs_uri(gcs_uri: str) -> tuple[str, str]:
+    """
+    Split a gs:// URI into bucket and object name
+
+    Args:
+        gcs_uri: URI like gs://bucket/path/to/object
+
+    Returns:
+        Tuple of (bucket_name, object_name)
+    """
+    if not gcs_uri.startswith("gs://"):
+        raise ValueError(f"Invalid GCS URI: {gcs_uri}")
+
+    path_parts = gcs_uri[5:].split("/", 1)
+    return path_parts[0], path_parts[1] if len(path_parts) > 1 else ""
+
+
+def generate_signed_url(gcs_uri: str, expiration: int = 3600, storage_client=None) -> str:
+    """
+    Mint a V4 signed URL so external services can read a GCS object
+
+    Requires service account credentials, since user credentials cannot sign
+    URLs. Pass the storage client that already holds them (see
+    VeoClient.get_video_signed_url); without one, a client is built from the
+    ambient application default credentials.
+
+    Args:
+        gcs_uri: URI like gs://bucket/path/to/object
+        expiration: URL lifetime in seconds
+        storage_client: google.cloud.storage Client to sign with
+
+    Returns:
+        HTTPS URL valid for ``expiration`` seconds
+    """
+    bucket_name, blob_name = parse_gcs_uri(gcs_uri)
+
+    if storage_client is None:
+        from google.cloud import storage
+        storage_client = storage.Client(project=os.getenv("GOOGLE_CLOUD_PROJECT"))
+
+    blob = storage_client.bucket(bucket_name).blob(blob_name)
+
+    url = blob.generate_signed_url(
+        version="v4",
+        expiration=timedelta(seconds=expiration),
+        method="GET"
+    )
+    logger.info("Signed URL generated for %s", gcs_uri)
+    return url
@@ -0,0 +1,84 @@
+"""
+Shared HTTP session for API calls and downloads
+"""
+import atexit
+import logging
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Get the process-wide pooled session, creating it on first use
+
+    Every client that talks plain HTTP shares this session, so a batch run
+    keeps one connection pool (and one set of TLS sessions) instead of one
+    per client. Auth headers are never set on the session itself; callers
+    pass them per request.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=32,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.3,
+                        status_forcelist=[429, 502, 503, 504]
+                    )
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                atexit.register(session.close)
+                _session = session
+                logger.debug("Created shared HTTP session")
+
+    return _session
+
+
+def ping(url: str, timeout: float = 5.0) -> requests.Response:
+    """
+    Send a HEAD request over the shared session's pooled connections, once
+
+    Unlike a request through the session, a failed or throttled ping is not
+    retried, so keepalive traffic never multiplies against a struggling API.
+
+    Args:
+        url: URL to ping
+        timeout: Connect/read timeout in seconds
+
+    Returns:
+        Response (of any status)
+    """
+    session = get_session()
+    adapter = session.get_adapter(url)
+
+    # A retry-free adapter that borrows the shared adapter's pools, so the
+    # ping lands on (and refreshes) the same connections the clients use.
+    # Never close it: that would clear the shared pools.
+    ping_adapter = HTTPAdapter(max_retries=0)
+    ping_adapter.poolmanager = adapter.poolmanager
+    ping_adapter.proxy_manager = adapter.proxy_manager
+
+    # Same TLS and proxy settings as a session request, or the connection
+    # would come from a differently keyed pool
+    settings = session.merge_environment_settings(url, {}, None, None, None)
+    request = session.prepare_request(requests.Request("HEAD", url))
+    response = ping_adapter.send(request, timeout=timeout, **settings)
+    # Consuming the (empty) body hands the connection back to the pool
+    response.content
+    return response
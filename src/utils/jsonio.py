@@ -0,0 +1,40 @@
+"""
+JSON encoding that uses orjson when it is installed
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: bytes) -> Any:
+    """
+    Decode JSON from raw bytes
+
+    Args:
+        data: UTF-8 encoded JSON
+
+    Returns:
+        Decoded value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_indented(value: Any) -> bytes:
+    """
+    Encode a value as JSON indented by two spaces
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2).encode("utf-8")
@@ -0,0 +1,31 @@
+"""
+Lazy package re-exports
+"""
+import importlib
+import sys
+from typing import Callable, Dict
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Callable[[str], object]:
+    """
+    Build a module __getattr__ that imports re-exported names on first access
+
+    Lets a package's __init__ re-export names from submodules that pull in
+    heavy SDKs without importing them up front (PEP 562).
+
+    Args:
+        package: The package's __name__
+        exports: Maps each exported name to its relative submodule
+
+    Returns:
+        Function to assign to the package's __getattr__
+    """
+    def __getattr__(name):
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
@@ -0,0 +1,51 @@
+"""
+Logging setup that keeps handler I/O off the worker threads
+"""
+import atexit
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+_listener = None
+_listener_lock = threading.Lock()
+
+
+def configure_logging(
+    level: int = logging.INFO,
+    fmt: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+):
+    """
+    Send root log records through a queue to a single writer thread
+
+    Scenes log from many threads at once; with a plain StreamHandler each
+    call takes the handler lock and writes to stderr itself. Here a record
+    is only enqueued, and one listener thread formats and writes it.
+
+    Like logging.basicConfig, this does nothing when the root logger
+    already has handlers (e.g. the host application configured logging).
+
+    Args:
+        level: Root logger level
+        fmt: Log record format
+    """
+    global _listener
+
+    root = logging.getLogger()
+
+    with _listener_lock:
+        if _listener is not None or root.handlers:
+            return
+
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter(fmt))
+
+        log_queue = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+
+        root.addHandler(QueueHandler(log_queue))
+        root.setLevel(level)
+
+        # Drain queued records before the interpreter exits
+        atexit.register(_listener.stop)
@@ -0,0 +1,191 @@
+"""
+Polling helpers shared by the API clients
+"""
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+def backoff_delay(
+    attempt: int,
+    initial: float,
+    maximum: float = 30.0,
+    factor: float = 2.0
+) -> float:
+    """
+    Compute the sleep before the next status poll
+
+    Grows exponentially from ``initial`` and adds up to one second of jitter
+    so concurrent jobs don't poll in lockstep.
+
+    Args:
+        attempt: Number of polls already made (0 for the first wait)
+        initial: Delay before the first re-poll in seconds
+        maximum: Upper bound for the delay in seconds
+        factor: Growth factor per attempt
+
+    Returns:
+        Delay in seconds
+    """
+    return min(maximum, initial * factor ** attempt + random.random())
+
+
+class _PollJob:
+    """Book-keeping for one job tracked by PollScheduler"""
+
+    def __init__(self, initial_interval: float, max_interval: float, backoff_factor: float):
+        self.future = Future()
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.attempt = 0
+        self.due = 0.0
+        self.in_flight = False
+
+
+class PollScheduler:
+    """
+    Polls many jobs from a single scheduler thread
+
+    Jobs sit in a min-heap ordered by next poll time. When checks come due
+    they run on a small worker pool, and unfinished jobs are re-queued with
+    exponential backoff. Waiting on N jobs costs a fixed number of threads
+    instead of one sleeping thread per job.
+    """
+
+    def __init__(
+        self,
+        check_fn: Callable[[Hashable], Optional[Any]],
+        max_workers: int = 4,
+        name: str = "poller"
+    ):
+        """
+        Initialize scheduler
+
+        Args:
+            check_fn: Called with a job key; returns the final result once the
+                      job is finished, None while it is still running, and
+                      raises if the job failed
+            max_workers: Number of checks that may run at once
+            name: Thread name prefix
+        """
+        self._check_fn = check_fn
+        self._name = name
+        self._heap = []
+        self._jobs: Dict[Hashable, _PollJob] = {}
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._thread = None
+
+    def submit(
+        self,
+        key: Hashable,
+        initial_interval: float = 5.0,
+        max_interval: float = 30.0,
+        backoff_factor: float = 2.0
+    ) -> Future:
+        """
+        Start polling a job (the first check runs immediately)
+
+        Args:
+            key: Job identifier passed to check_fn
+            initial_interval: Delay after the first unfinished check in seconds
+            max_interval: Upper bound for the delay between checks in seconds
+            backoff_factor: Growth factor for the delay after each check
+
+        Returns:
+            Future resolved with check_fn's final result
+        """
+        with self._cond:
+            job = self._jobs.get(key)
+            if job is not None:
+                return job.future
+
+            job = _PollJob(initial_interval, max_interval, backoff_factor)
+            self._jobs[key] = job
+            self._schedule(key, job, 0.0)
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+
+            return job.future
+
+    def poll_now(self, key: Hashable):
+        """Check a job right away, e.g. after a completion callback"""
+        with self._cond:
+            job = self._jobs.get(key)
+            if job is not None and not job.in_flight:
+                self._schedule(key, job, 0.0)
+
+    def cancel(self, key: Hashable):
+        """Stop polling a job and cancel its future"""
+        with self._cond:
+            job = self._jobs.pop(key, None)
+        if job is not None:
+            job.future.cancel()
+
+    def _schedule(self, key: Hashable, job: _PollJob, delay: float):
+        """Queue the next check for a job (caller holds the lock)"""
+        job.due = time.monotonic() + delay
+        heapq.heappush(self._heap, (job.due, next(self._seq), key))
+        self._cond.notify()
+
+    def _run(self):
+        """Scheduler loop: sleep until the earliest job is due, then dispatch"""
+        while True:
+            with self._cond:
+                while not self._heap or self._heap[0][0] > time.monotonic():
+                    timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+                    self._cond.wait(timeout)
+
+                due_keys = []
+                now = time.monotonic()
+                while self._heap and self._heap[0][0] <= now:
+                    due, _, key = heapq.heappop(self._heap)
+                    job = self._jobs.get(key)
+                    # Skip entries superseded by a later reschedule
+                    if job is not None and job.due == due and not job.in_flight:
+                        job.in_flight = True
+                        due_keys.append(key)
+
+            for key in due_keys:
+                self._pool.submit(self._check, key)
+
+    def _check(self, key: Hashable):
+        """Run one check and either finish the job or requeue it"""
+        try:
+            result = self._check_fn(key)
+        except Exception as e:
+            self._finish(key, exception=e)
+            return
+
+        if result is not None:
+            self._finish(key, result=result)
+            return
+
+        with self._cond:
+            job = self._jobs.get(key)
+            if job is not None:
+                job.in_flight = False
+                delay = backoff_delay(
+                    job.attempt, job.initial_interval, job.max_interval, job.backoff_factor
+                )
+                job.attempt += 1
+                self._schedule(key, job, delay)
+
+    def _finish(self, key: Hashable, result: Any = None, exception: Optional[BaseException] = None):
+        """Resolve a job's future and stop tracking it"""
+        with self._cond:
+            job = self._jobs.pop(key, None)
+        if job is None or job.future.cancelled():
+            return
+        if exception is not None:
+            job.future.set_exception(exception)
+        else:
+            job.future.set_result(result)
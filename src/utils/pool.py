@@ -0,0 +1,62 @@
+"""
+Process-wide thread pool for short-lived batches of I/O work
+"""
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+_max_workers = 16
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_shared_pool() -> ThreadPoolExecutor:
+    """
+    Get the shared worker pool, creating it on first use
+
+    YouTube batch downloads submit to this pool instead of spinning up a
+    fresh executor per call, so worker threads stay warm between batches.
+    Callers must not shut it down, and should call this for each submit
+    rather than holding on to the pool (see set_max_workers).
+
+    Returns:
+        Shared ThreadPoolExecutor
+    """
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=_max_workers, thread_name_prefix="shared")
+    return _pool
+
+
+def set_max_workers(max_workers: int):
+    """
+    Resize the shared pool
+
+    Work already submitted to the previous pool still runs to completion,
+    but the previous pool accepts no new work.
+
+    Args:
+        max_workers: Number of worker threads
+    """
+    global _pool, _max_workers
+
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    with _pool_lock:
+        _max_workers = max_workers
+        old_pool, _pool = _pool, None
+
+    if old_pool is not None:
+        old_pool.shutdown(wait=False)
+
+
+@atexit.register
+def _shutdown_shared_pool():
+    with _pool_lock:
+        pool = _pool
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
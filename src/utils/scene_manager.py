@@ -2,13 +2,31 @@
 Scene management and folder structure handling
 """
 import os
-import json
+import copy
+import atexit
 import logging
+import tempfile
+import threading
+import weakref
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+
+from src.utils import jsonio
 
 logger = logging.getLogger(__name__)
 
+# Managers with buffered metadata, flushed when the interpreter exits
+_live_managers = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all_managers():
+    for manager in list(_live_managers):
+        try:
+            manager.flush()
+        except Exception as e:
+            logger.error("Error flushing scene metadata at exit: %s", e)
+
 
 class SceneManager:
     """Manages scene folders and metadata"""
@@ -25,10 +43,32 @@ class SceneManager:
         self.project_name = project_name
         self.project_dir = self.projects_root / project_name
 
+        # Parsed metadata keyed by scene_id, tagged with the file's
+        # (mtime_ns, size) so edits from other processes are picked up
+        self._meta_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+        # Write-behind buffer: updates to a scene within _flush_interval
+        # seconds are coalesced into a single write of its metadata.json
+        self._dirty: Dict[str, Dict[str, Any]] = {}
+        self._flushing: Dict[str, Dict[str, Any]] = {}
+        # Bumped on every buffered update, so a failed flush can tell
+        # whether its copy is still the newest one
+        self._versions: Dict[str, int] = {}
+        self._flush_interval = 0.5
+        self._flush_timer = None
+        self._lock = threading.Lock()
+        # Scene threads and the timer all flush; only one may write at a time
+        self._flush_lock = threading.Lock()
+        _live_managers.add(self)
+
+        # Serializes load-modify-save updates so concurrent scene threads
+        # can't drop each other's changes
+        self._update_lock = threading.RLock()
+
         # Create base directories
         self.project_dir.mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"Initialized SceneManager at {self.project_dir}")
+        logger.info("Initialized SceneManager at %s", self.project_dir)
 
     def create_scene(self, scene_id: str) -> str:
         """
@@ -45,16 +85,17 @@ class SceneManager:
 
         # Create metadata file
         metadata_path = scene_path / "metadata.json"
-        if not metadata_path.exists():
-            metadata = {
-                "scene_id": scene_id,
-                "created_at": None,
-                "status": "created",
-                "files": {}
-            }
-            self._save_metadata(scene_id, metadata)
-
-        logger.info(f"Created scene folder: {scene_path}")
+        with self._update_lock:
+            if scene_id not in self._dirty and scene_id not in self._flushing and not metadata_path.exists():
+                metadata = {
+                    "scene_id": scene_id,
+                    "created_at": None,
+                    "status": "created",
+                    "files": {}
+                }
+                self._save_metadata(scene_id, metadata)
+
+        logger.info("Created scene folder: %s", scene_path)
         return str(scene_path)
 
     def get_scene_path(self, scene_id: str) -> str:
@@ -85,15 +126,16 @@ class SceneManager:
             file_path: Path to the file
             metadata: Additional metadata for the file
         """
-        scene_metadata = self._load_metadata(scene_id)
+        with self._update_lock:
+            scene_metadata = self._load_metadata(scene_id)
 
-        scene_metadata["files"][file_type] = {
-            "path": file_path,
-            "metadata": metadata or {}
-        }
+            scene_metadata["files"][file_type] = {
+                "path": file_path,
+                "metadata": metadata or {}
+            }
 
-        self._save_metadata(scene_id, scene_metadata)
-        logger.info(f"Saved {file_type} reference for {scene_id}: {file_path}")
+            self._save_metadata(scene_id, scene_metadata)
+        logger.info("Saved %s reference for %s: %s", file_type, scene_id, file_path)
 
     def get_file_path(self, scene_id: str, file_type: str) -> Optional[str]:
         """
@@ -119,11 +161,12 @@ class SceneManager:
             scene_id: Scene identifier
             status: New status (e.g., 'generating', 'processing', 'completed')
         """
-        scene_metadata = self._load_metadata(scene_id)
-        scene_metadata["status"] = status
-        self._save_metadata(scene_id, scene_metadata)
+        with self._update_lock:
+            scene_metadata = self._load_metadata(scene_id)
+            scene_metadata["status"] = status
+            self._save_metadata(scene_id, scene_metadata)
 
-        logger.info(f"Updated {scene_id} status to: {status}")
+        logger.info("Updated %s status to: %s", scene_id, status)
 
     def save_generation_info(
         self,
@@ -148,20 +191,21 @@ class SceneManager:
             dialogue: Optional dialogue text for TTS
         """
         import time
-        scene_metadata = self._load_metadata(scene_id)
-
-        scene_metadata["generation"] = {
-            "prompt": prompt,
-            "input_video": input_video,
-            "input_image": input_image,
-            "provider": provider,
-            "model": model,
-            "dialogue": dialogue,
-            "generated_at": time.strftime("%Y-%m-%d %H:%M:%S")
-        }
+        with self._update_lock:
+            scene_metadata = self._load_metadata(scene_id)
+
+            scene_metadata["generation"] = {
+                "prompt": prompt,
+                "input_video": input_video,
+                "input_image": input_image,
+                "provider": provider,
+                "model": model,
+                "dialogue": dialogue,
+                "generated_at": time.strftime("%Y-%m-%d %H:%M:%S")
+            }
 
-        self._save_metadata(scene_id, scene_metadata)
-        logger.info(f"Saved generation info for {scene_id}")
+            self._save_metadata(scene_id, scene_metadata)
+        logger.info("Saved generation info for %s", scene_id)
 
     def save_video_description(
         self,
@@ -182,18 +226,19 @@ class SceneManager:
             analyzed_by: Model/service used for analysis
         """
         import time
-        scene_metadata = self._load_metadata(scene_id)
-
-        scene_metadata["video_analysis"] = {
-            "description": description,
-            "short_description": short_description,
-            "tags": tags or [],
-            "analyzed_by": analyzed_by,
-            "analyzed_at": time.strftime("%Y-%m-%d %H:%M:%S")
-        }
+        with self._update_lock:
+            scene_metadata = self._load_metadata(scene_id)
+
+            scene_metadata["video_analysis"] = {
+                "description": description,
+                "short_description": short_description,
+                "tags": tags or [],
+                "analyzed_by": analyzed_by,
+                "analyzed_at": time.strftime("%Y-%m-%d %H:%M:%S")
+            }
 
-        self._save_metadata(scene_id, scene_metadata)
-        logger.info(f"Saved video description for {scene_id}")
+            self._save_metadata(scene_id, scene_metadata)
+        logger.info("Saved video description for %s", scene_id)
 
     def get_scene_metadata(self, scene_id: str) -> Dict[str, Any]:
         """
@@ -214,13 +259,13 @@ class SceneManager:
         Returns:
             List of scene identifiers
         """
-        scenes = []
-        if self.project_dir.exists():
-            for item in self.project_dir.iterdir():
-                if item.is_dir():
-                    scenes.append(item.name)
-
-        return sorted(scenes)
+        # DirEntry.is_dir() uses the file type from the directory listing,
+        # avoiding a stat per entry
+        try:
+            with os.scandir(self.project_dir) as entries:
+                return sorted(entry.name for entry in entries if entry.is_dir())
+        except FileNotFoundError:
+            return []
 
     def get_project_structure(self) -> Dict[str, Any]:
         """
@@ -245,32 +290,132 @@ class SceneManager:
 
         return structure
 
+    def flush(self):
+        """Write all buffered metadata updates to disk"""
+        with self._flush_lock:
+            with self._lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                dirty, self._dirty = self._dirty, {}
+                versions = {scene_id: self._versions[scene_id] for scene_id in dirty}
+                # Stay visible to readers until the write has landed
+                self._flushing.update(dirty)
+
+            failed = []
+            for scene_id, metadata in dirty.items():
+                try:
+                    self._write_metadata(scene_id, metadata)
+                except Exception:
+                    failed.append(scene_id)
+                    # Retry on the next flush, unless a newer update was
+                    # buffered meanwhile (it supersedes this one)
+                    with self._lock:
+                        if self._versions[scene_id] == versions[scene_id]:
+                            self._dirty[scene_id] = metadata
+                finally:
+                    with self._lock:
+                        if self._flushing.get(scene_id) is metadata:
+                            del self._flushing[scene_id]
+
+        if failed:
+            raise Exception(f"Failed to save metadata for: {', '.join(failed)}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+
+    def _flush_in_background(self):
+        """Timer callback: flush and log instead of raising in the timer thread"""
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error("Background metadata flush failed: %s", e)
+
     def _load_metadata(self, scene_id: str) -> Dict[str, Any]:
         """Load scene metadata from JSON file"""
+        # Buffered updates are newer than anything on disk
+        with self._lock:
+            pending = self._dirty.get(scene_id) or self._flushing.get(scene_id)
+            if pending is not None:
+                return copy.deepcopy(pending)
+
         metadata_path = self.project_dir / scene_id / "metadata.json"
 
-        if not metadata_path.exists():
+        try:
+            stat = metadata_path.stat()
+        except FileNotFoundError:
+            self._meta_cache.pop(scene_id, None)
             return {
                 "scene_id": scene_id,
                 "status": "unknown",
                 "files": {}
             }
 
+        # Callers mutate the returned dict, so hand out copies of the cache
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._meta_cache.get(scene_id)
+        if cached is not None and cached[0] == version:
+            return copy.deepcopy(cached[1])
+
         try:
-            with open(metadata_path, 'r') as f:
-                return json.load(f)
+            with open(metadata_path, 'rb') as f:
+                metadata = jsonio.loads(f.read())
+            self._meta_cache[scene_id] = (version, metadata)
+            return copy.deepcopy(metadata)
         except Exception as e:
-            logger.error(f"Error loading metadata for {scene_id}: {str(e)}")
+            self._meta_cache.pop(scene_id, None)
+            logger.error("Error loading metadata for %s: %s", scene_id, e)
             return {"scene_id": scene_id, "status": "error", "files": {}}
 
     def _save_metadata(self, scene_id: str, metadata: Dict[str, Any]):
-        """Save scene metadata to JSON file"""
+        """Buffer scene metadata; it is written on the next flush"""
+        with self._lock:
+            self._dirty[scene_id] = copy.deepcopy(metadata)
+            self._versions[scene_id] = self._versions.get(scene_id, 0) + 1
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self._flush_interval, self._flush_in_background)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _write_metadata(self, scene_id: str, metadata: Dict[str, Any]):
+        """Write scene metadata to JSON file"""
         metadata_path = self.project_dir / scene_id / "metadata.json"
 
         try:
-            metadata_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, indent=2, fp=f)
+            data = jsonio.dumps_indented(metadata)
+
+            # Write a temp file and rename it over metadata.json, so a crash
+            # mid-write never leaves a truncated file behind. The temp name
+            # is unique per write, so concurrent flushes never share one.
+            try:
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=metadata_path.parent, prefix="metadata.", suffix=".json.tmp"
+                )
+            except FileNotFoundError:
+                # Scene folder not created through create_scene
+                metadata_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=metadata_path.parent, prefix="metadata.", suffix=".json.tmp"
+                )
+            try:
+                with os.fdopen(fd, 'wb') as tmp_file:
+                    tmp_file.write(data)
+                # mkstemp creates 0600; keep metadata readable like before
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, metadata_path)
+            except BaseException:
+                try:
+                    os.remove(tmp_path)
+                except FileNotFoundError:
+                    pass
+                raise
+
+            stat = metadata_path.stat()
+            self._meta_cache[scene_id] = ((stat.st_mtime_ns, stat.st_size), metadata)
         except Exception as e:
-            logger.error(f"Error saving metadata for {scene_id}: {str(e)}")
+            self._meta_cache.pop(scene_id, None)
+            logger.error("Error saving metadata for %s: %s", scene_id, e)
             raise
@@ -3,25 +3,67 @@ Video processing utilities: download and ProRes conversion
 """
 import os
 import logging
+import platform
+import queue
+import threading
 import requests
 import ffmpeg
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
+
+from src.utils.http import get_session
+from src.utils.fs import ensure_parent_dir
 
 logger = logging.getLogger(__name__)
 
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+
+# Threads per ffmpeg encode; concurrent encodes are capped so that together
+# they roughly fill the machine instead of oversubscribing it
+FFMPEG_THREADS = 4
+_encode_slots = threading.BoundedSemaphore(max(1, (os.cpu_count() or FFMPEG_THREADS) // FFMPEG_THREADS))
+
+SOFTWARE_PRORES_ENCODER = "prores_ks"
+HARDWARE_PRORES_ENCODER = "prores_videotoolbox"
+
+
+def _default_prores_encoder() -> str:
+    """
+    Pick the ProRes encoder for this machine
+
+    Apple Silicon Macs have a dedicated ProRes engine, so they use
+    VideoToolbox; everything else uses ffmpeg's software encoder.
+    FFMPEG_PRORES_ENCODER overrides the choice.
+
+    Returns:
+        ffmpeg encoder name
+    """
+    override = os.getenv("FFMPEG_PRORES_ENCODER")
+    if override:
+        return override
+    if platform.system() == "Darwin" and platform.machine() == "arm64":
+        return HARDWARE_PRORES_ENCODER
+    return SOFTWARE_PRORES_ENCODER
+
 
 class VideoProcessor:
     """Handles video download and format conversion"""
 
-    def __init__(self, prores_profile: int = 2):
+    def __init__(self, prores_profile: int = 2, session: Optional[requests.Session] = None):
         """
         Initialize video processor
 
         Args:
             prores_profile: ProRes profile (0=Proxy, 1=LT, 2=422, 3=422HQ)
+            session: HTTP session for downloads (defaults to the shared session)
         """
         self.prores_profile = prores_profile
+        self.session = session or get_session()
+        self._prores_encoder = _default_prores_encoder()
+
+        # Reusable download buffers, one per download in flight
+        self._chunk_pool = queue.LifoQueue()
 
     def download_video(self, url: str, output_path: str) -> str:
         """
@@ -34,29 +76,61 @@ class VideoProcessor:
         Returns:
             Path to downloaded file
         """
-        logger.info(f"Downloading video from {url}")
+        logger.info("Downloading video from %s", url)
 
         try:
             # Create output directory if it doesn't exist
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-            # Download with streaming to handle large files
-            response = requests.get(url, stream=True, timeout=300)
-            response.raise_for_status()
+            ensure_parent_dir(output_path)
 
-            # Write to file
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            with open(output_path, 'wb', buffering=DOWNLOAD_BUFFER_SIZE) as f:
+                for chunk in self.iter_download(url):
+                    f.write(chunk)
 
-            logger.info(f"Downloaded video to {output_path}")
+            logger.info("Downloaded video to %s", output_path)
             return output_path
 
         except Exception as e:
-            logger.error(f"Error downloading video: {str(e)}")
+            logger.error("Error downloading video: %s", e)
             raise
 
+    def _acquire_buffer(self) -> bytearray:
+        """Take a download buffer from the pool, allocating one if it's empty"""
+        try:
+            return self._chunk_pool.get_nowait()
+        except queue.Empty:
+            return bytearray(DOWNLOAD_CHUNK_SIZE)
+
+    def iter_download(self, url: str) -> Iterator[memoryview]:
+        """
+        Stream a video from a URL as it downloads
+
+        The body is read into one 256 KiB buffer taken from the processor's
+        pool instead of allocating a bytes object per chunk. Each yielded
+        chunk is a view of that buffer and is only valid until the next one
+        is requested, so consumers must write it out (or copy it) right away.
+
+        Args:
+            url: Video URL
+
+        Yields:
+            Chunks of the video file in order
+        """
+        buffer = self._acquire_buffer()
+        try:
+            with self.session.get(url, stream=True, timeout=300) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+
+                with memoryview(buffer) as view:
+                    while True:
+                        n = response.raw.readinto(buffer)
+                        if not n:
+                            break
+                        with view[:n] as chunk:
+                            yield chunk
+        finally:
+            self._chunk_pool.put(buffer)
+
     def convert_to_h264(
         self,
         input_path: str,
@@ -80,7 +154,7 @@ class VideoProcessor:
             input_file = Path(input_path)
             output_path = str(input_file.parent / f"{input_file.stem}_h264.mp4")
 
-        logger.info(f"Converting {input_path} to H264/MP4")
+        logger.info("Converting %s to H264/MP4", input_path)
 
         try:
             # Convert to H264 using ffmpeg-python
@@ -101,14 +175,14 @@ class VideoProcessor:
             # Run conversion
             ffmpeg.run(stream, overwrite_output=True, capture_stdout=True, capture_stderr=True)
 
-            logger.info(f"Converted to H264: {output_path}")
+            logger.info("Converted to H264: %s", output_path)
             return output_path
 
         except ffmpeg.Error as e:
-            logger.error(f"FFmpeg error: {e.stderr.decode()}")
+            logger.error("FFmpeg error: %s", e.stderr.decode())
             raise
         except Exception as e:
-            logger.error(f"Error converting video: {str(e)}")
+            logger.error("Error converting video: %s", e)
             raise
 
     def convert_to_prores(
@@ -134,36 +208,157 @@ class VideoProcessor:
             input_file = Path(input_path)
             output_path = str(input_file.parent / f"{input_file.stem}_prores.mov")
 
-        logger.info(f"Converting {input_path} to ProRes 422")
+        logger.info("Converting %s to ProRes 422 (%s)", input_path, self._prores_encoder)
 
         try:
-            # Convert to ProRes using ffmpeg-python
-            stream = ffmpeg.input(input_path)
-            stream = ffmpeg.output(
-                stream,
-                output_path,
-                vcodec='prores_ks',
-                profile=self.prores_profile,
-                vendor='apl0',
-                pix_fmt='yuv422p10le',
-                acodec='pcm_s16le',
-                ar='48000',
-                ac=2
-            )
-
-            # Run conversion
-            ffmpeg.run(stream, overwrite_output=True, capture_stdout=True, capture_stderr=True)
-
-            logger.info(f"Converted to ProRes: {output_path}")
+            try:
+                self._run_prores(input_path, output_path, self._prores_encoder)
+            except ffmpeg.Error as e:
+                if self._prores_encoder == SOFTWARE_PRORES_ENCODER:
+                    raise
+                # Hardware encoder unavailable (older ffmpeg, VM, odd input):
+                # fall back to software for this and later conversions
+                logger.warning(
+                    "%s failed, falling back to %s: %s",
+                    self._prores_encoder, SOFTWARE_PRORES_ENCODER, e.stderr.decode()
+                )
+                self._prores_encoder = SOFTWARE_PRORES_ENCODER
+                self._run_prores(input_path, output_path, self._prores_encoder)
+
+            logger.info("Converted to ProRes: %s", output_path)
             return output_path
 
         except ffmpeg.Error as e:
-            logger.error(f"FFmpeg error: {e.stderr.decode()}")
+            logger.error("FFmpeg error: %s", e.stderr.decode())
             raise
         except Exception as e:
-            logger.error(f"Error converting video: {str(e)}")
+            logger.error("Error converting video: %s", e)
             raise
 
+    def stream_to_prores(
+        self,
+        chunks: Iterable[bytes],
+        output_path: str,
+        tee_path: str
+    ) -> str:
+        """
+        Encode a video to ProRes while it is still downloading
+
+        Chunks are fed to ffmpeg's stdin and written to tee_path at the same
+        time, so the encode overlaps the download and the source is never
+        read back from disk. MP4s with their index at the end can't be
+        decoded from a pipe; then (or if ffmpeg fails for any other reason)
+        the finished tee file is converted with convert_to_prores.
+
+        Args:
+            chunks: Source video bytes in order
+            output_path: Path for the ProRes output
+            tee_path: Path that receives a copy of the source video
+
+        Returns:
+            Path to converted ProRes file
+        """
+        logger.info("Streaming %s to ProRes 422 (%s)", tee_path, self._prores_encoder)
+
+        ensure_parent_dir(output_path)
+        ensure_parent_dir(tee_path)
+
+        # The streamed encode is as CPU-bound as a from-disk one once the link
+        # is fast, so it holds an encode slot too. The chunks are only pulled
+        # once the slot is taken, so waiting scenes don't hold a download open.
+        # The slot is released before the from-disk fallback takes its own.
+        with _encode_slots:
+            process = self._prores_stream(
+                'pipe:0', output_path, self._prores_encoder
+            ).run_async(pipe_stdin=True, pipe_stderr=True, overwrite_output=True)
+
+            # Drain stderr so ffmpeg never blocks on a full pipe
+            stderr = []
+            stderr_thread = threading.Thread(
+                target=lambda: stderr.append(process.stderr.read()),
+                name="ffmpeg-stderr",
+                daemon=True
+            )
+            stderr_thread.start()
+
+            piping = True
+            try:
+                with open(tee_path, 'wb', buffering=DOWNLOAD_BUFFER_SIZE) as tee:
+                    for chunk in chunks:
+                        tee.write(chunk)
+                        if piping:
+                            try:
+                                process.stdin.write(chunk)
+                            except BrokenPipeError:
+                                # ffmpeg gave up; keep downloading into the tee
+                                piping = False
+            except Exception:
+                process.kill()
+                raise
+            finally:
+                try:
+                    process.stdin.close()
+                except BrokenPipeError:
+                    pass
+                process.wait()
+                stderr_thread.join()
+
+        if process.returncode == 0:
+            logger.info("Converted to ProRes: %s", output_path)
+            return output_path
+
+        logger.warning(
+            "Streaming ProRes encode failed, converting %s from disk: %s",
+            tee_path, b"".join(stderr).decode(errors="replace")
+        )
+        return self.convert_to_prores(tee_path, output_path)
+
+    def _prores_stream(self, input_path: str, output_path: str, encoder: str):
+        """
+        Build the ffmpeg graph for a ProRes encode
+
+        Args:
+            input_path: Path to input video (or pipe:0)
+            output_path: Path for output video
+            encoder: prores_ks or prores_videotoolbox
+
+        Returns:
+            ffmpeg-python output stream
+        """
+        if encoder == HARDWARE_PRORES_ENCODER:
+            # Decode on the media engine too, and let VideoToolbox fall back
+            # to its software path rather than fail
+            stream = ffmpeg.input(input_path, hwaccel='videotoolbox')
+            video_args = {'allow_sw': 1, 'pix_fmt': 'p210le'}
+        else:
+            stream = ffmpeg.input(input_path)
+            video_args = {'vendor': 'apl0', 'pix_fmt': 'yuv422p10le'}
+
+        return ffmpeg.output(
+            stream,
+            output_path,
+            vcodec=encoder,
+            profile=self.prores_profile,
+            acodec='pcm_s16le',
+            ar='48000',
+            ac=2,
+            threads=FFMPEG_THREADS,
+            **video_args
+        )
+
+    def _run_prores(self, input_path: str, output_path: str, encoder: str):
+        """
+        Run one ffmpeg ProRes encode
+
+        Args:
+            input_path: Path to input video
+            output_path: Path for output video
+            encoder: prores_ks or prores_videotoolbox
+        """
+        stream = self._prores_stream(input_path, output_path, encoder)
+        with _encode_slots:
+            ffmpeg.run(stream, overwrite_output=True, capture_stdout=True, capture_stderr=True)
+
     def get_video_info(self, file_path: str) -> dict:
         """
         Get video information using ffprobe
@@ -187,7 +382,7 @@ class VideoProcessor:
                 'fps': eval(video_info['r_frame_rate'])
             }
         except Exception as e:
-            logger.error(f"Error getting video info: {str(e)}")
+            logger.error("Error getting video info: %s", e)
             raise
 
     def process_video_pipeline(
@@ -199,6 +394,10 @@ class VideoProcessor:
         """
         Complete pipeline: download and convert to ProRes
 
+        The download is piped straight into ffmpeg while the raw MP4 is
+        written alongside it (lip-sync needs the original), so the clip is
+        never read back from disk for the encode.
+
         Args:
             video_url: URL of generated video
             scene_dir: Scene directory path
@@ -207,15 +406,10 @@ class VideoProcessor:
         Returns:
             Tuple of (raw_video_path, prores_video_path)
         """
-        # Create scene directory
-        os.makedirs(scene_dir, exist_ok=True)
-
-        # Download video
         raw_path = os.path.join(scene_dir, f"{scene_id}_raw.mp4")
-        self.download_video(video_url, raw_path)
-
-        # Convert to ProRes
         prores_path = os.path.join(scene_dir, f"{scene_id}_prores.mov")
-        self.convert_to_prores(raw_path, prores_path)
+
+        logger.info("Downloading video from %s", video_url)
+        self.stream_to_prores(self.iter_download(video_url), prores_path, tee_path=raw_path)
 
         return raw_path, prores_path
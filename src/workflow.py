@@ -3,23 +3,33 @@ Main workflow orchestrator for video generation pipeline
 """
 import os
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, Union
 from pathlib import Path
 
-from src.clients.tts_client import TTSClient
-from src.clients.lipsync_client import LipSyncClient
 from src.utils.video_processor import VideoProcessor
 from src.utils.scene_manager import SceneManager
+from src.utils.http import get_session, ping
+from src.utils.log import configure_logging
 from src.models.prompt import VideoPrompt, SceneConfig
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+configure_logging(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Deliverable formats for process_scene
+OUTPUT_FORMATS = ("prores", "mp4")
 
-def get_video_client():
+# Background stages a scene can have in flight at once (TTS, raw ProRes encode)
+STAGES_PER_SCENE = 2
+
+
+def _scene_concurrency(max_workers: Optional[int] = None) -> int:
+    """Scenes processed at once: max_workers, else MAX_SCENE_CONCURRENCY, else 8"""
+    return max_workers or int(os.getenv("MAX_SCENE_CONCURRENCY", "0")) or 8
+
+
+def get_video_client(session=None):
     """
     Factory function to get the appropriate video generation client
     based on VIDEO_PROVIDER environment variable.
@@ -29,6 +39,9 @@ def get_video_client():
         - "replicate": Replicate API with Wan models (cheap, good quality)
         - "sora": OpenAI Sora API (medium cost, excellent quality)
 
+    Args:
+        session: HTTP session for video downloads (defaults to the shared session)
+
     Returns:
         VeoClient, ReplicateClient, or SoraClient based on configuration
     """
@@ -37,11 +50,11 @@ def get_video_client():
     if provider == "replicate":
         from src.clients.replicate_client import ReplicateClient
         logger.info("Using Replicate API (cheap mode - ~$0.05/video)")
-        return ReplicateClient()
+        return ReplicateClient(session=session)
     elif provider == "sora":
         from src.clients.sora_client import SoraClient
         logger.info("Using OpenAI Sora API (~$0.50-2.50/video)")
-        return SoraClient()
+        return SoraClient(session=session)
     else:
         from src.clients.veo_client import VeoClient
         logger.info("Using Google Veo API (expensive - ~$1.75/video)")
@@ -75,14 +88,145 @@ class VideoProductionWorkflow:
         self.projects_root = projects_root
         self.project_name = project_name
 
-        # Initialize clients - use factory for video client
-        self.video_client = get_video_client()
-        self.tts_client = TTSClient()
-        self.lipsync_client = LipSyncClient()
-        self.video_processor = VideoProcessor(prores_profile=prores_profile)
+        # API clients (and their SDKs) are created on first use, so a run
+        # that never reaches a step doesn't pay for importing its client
+        self._video_client = None
+        self._tts_client = None
+        self._lipsync_client = None
+        self._client_lock = threading.Lock()
+
+        # D-ID calls and all video downloads share one pooled HTTP session
+        self._session = get_session()
+        self.video_processor = VideoProcessor(prores_profile=prores_profile, session=self._session)
         self.scene_manager = SceneManager(projects_root=projects_root, project_name=project_name)
 
-        logger.info(f"Initialized VideoProductionWorkflow for project '{project_name}'")
+        # Runs the independent stages of a scene (TTS, raw ProRes encode)
+        # alongside the Veo -> lip-sync critical path. Each scene has at most
+        # two stages in flight, so size for that many per concurrent scene
+        # (threads are only started when needed).
+        self._stage_workers = STAGES_PER_SCENE * _scene_concurrency()
+        self._stage_executor = ThreadPoolExecutor(
+            max_workers=self._stage_workers,
+            thread_name_prefix="scene-stage"
+        )
+        self._stage_lock = threading.Lock()
+        # Pools replaced by _ensure_stage_workers, shut down in close()
+        self._retired_stage_executors = []
+
+        # Pooled HTTPS connections go stale between the scenes of a batch
+        # (idle timeouts on the server side), so they are pinged while a
+        # batch runs; 0 disables
+        self._keepalive_interval = float(os.getenv("HTTP_KEEPALIVE_INTERVAL", "25"))
+
+        logger.info("Initialized VideoProductionWorkflow for project '%s'", project_name)
+
+    @property
+    def video_client(self):
+        """Video generation client for VIDEO_PROVIDER, created on first use"""
+        return self._get_client("_video_client", lambda: get_video_client(session=self._session))
+
+    @property
+    def tts_client(self):
+        """ElevenLabs TTS client, created on first use"""
+        def create():
+            from src.clients.tts_client import TTSClient
+            return TTSClient()
+
+        return self._get_client("_tts_client", create)
+
+    @property
+    def lipsync_client(self):
+        """D-ID lip-sync client, created on first use"""
+        def create():
+            from src.clients.lipsync_client import LipSyncClient
+            return LipSyncClient(session=self._session)
+
+        return self._get_client("_lipsync_client", create)
+
+    def close(self):
+        """Release the stage workers"""
+        with self._stage_lock:
+            executors = self._retired_stage_executors + [self._stage_executor]
+            self._retired_stage_executors = []
+        for executor in executors:
+            executor.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _start_keepalive(self) -> threading.Event:
+        """
+        Start pinging the HTTP APIs in use until the returned event is set
+
+        Returns:
+            Event that stops the pings
+        """
+        stop = threading.Event()
+        if self._keepalive_interval > 0:
+            threading.Thread(
+                target=self._keepalive_loop,
+                args=(stop,),
+                name="http-keepalive",
+                daemon=True
+            ).start()
+        return stop
+
+    def _keepalive_loop(self, stop: threading.Event):
+        """Periodically ping the APIs served by the shared session"""
+        while not stop.wait(self._keepalive_interval):
+            # Veo and ElevenLabs go through their SDKs' own HTTP clients, so
+            # only D-ID shares the pool, and only once a scene has used it
+            lipsync_client = self._lipsync_client
+            if lipsync_client is None:
+                continue
+
+            try:
+                ping(lipsync_client.base_url)
+            except Exception as e:
+                logger.debug("Keepalive ping failed: %s", e)
+
+    def _ensure_stage_workers(self, workers: int):
+        """
+        Grow the stage pool so every scene in flight gets its own stage workers
+
+        Args:
+            workers: Minimum number of stage workers
+        """
+        with self._stage_lock:
+            if workers <= self._stage_workers:
+                return
+            # Not shut down yet: scenes already running keep submitting to
+            # the old pool until they finish
+            self._retired_stage_executors.append(self._stage_executor)
+            self._stage_executor = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="scene-stage"
+            )
+            self._stage_workers = workers
+
+    def _get_client(self, attr: str, factory):
+        """
+        Return a lazily created client, creating it at most once
+
+        Args:
+            attr: Instance attribute caching the client
+            factory: Called to create the client on first access
+
+        Returns:
+            Client instance
+        """
+        client = getattr(self, attr)
+        if client is None:
+            # Scenes run concurrently in batch mode
+            with self._client_lock:
+                client = getattr(self, attr)
+                if client is None:
+                    client = factory()
+                    setattr(self, attr, client)
+        return client
 
     def process_scene(
         self,
@@ -90,7 +234,8 @@ class VideoProductionWorkflow:
         voice_id: Optional[str] = None,
         skip_lipsync: bool = False,
         input_video: Optional[str] = None,
-        input_image: Optional[str] = None
+        input_image: Optional[str] = None,
+        output_format: str = "prores"
     ) -> dict:
         """
         Process a complete scene through the pipeline
@@ -101,19 +246,35 @@ class VideoProductionWorkflow:
             skip_lipsync: Skip lip-sync step if True
             input_video: Optional path to input video for extension or GCS URI
             input_image: Optional path to input image for image-to-video (first frame)
+            output_format: "prores" to encode the final video for FCP, or "mp4"
+                           to deliver the generated/lip-synced MP4 as is
 
         Returns:
-            Dictionary with paths to generated files
+            Dictionary with paths to generated files ("final" is the deliverable)
         """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Unknown output format: {output_format} (expected one of {', '.join(OUTPUT_FORMATS)})"
+            )
+        encode_prores = output_format == "prores"
+
         scene_id = scene_config.scene_id
         prompt = scene_config.prompt
 
-        logger.info(f"=== Processing {scene_id} ===")
+        logger.info("=== Processing %s ===", scene_id)
 
         # Create scene folder
         scene_path = self.scene_manager.create_scene(scene_id)
         self.scene_manager.update_scene_status(scene_id, "generating_video")
 
+        # Output files of every step, named "<scene_id>_<suffix>"
+        file_prefix = os.path.join(scene_path, scene_id)
+        audio_path = f"{file_prefix}_dialogue.wav"
+        raw_video_path = f"{file_prefix}_raw.mp4"
+        prores_path = f"{file_prefix}_prores.mov"
+        synced_path = f"{file_prefix}_synced.mp4"
+        final_prores_path = f"{file_prefix}_final_prores.mov"
+
         # Get provider and model info
         provider = os.getenv("VIDEO_PROVIDER", "veo")
         model = None
@@ -124,9 +285,12 @@ class VideoProductionWorkflow:
         elif provider == "veo":
             model = os.getenv("VEO_MODEL", "veo-2.0-generate-001")
 
-        # Save generation info to metadata
+        # Build the prompt and dialogue once; every step below reuses them
         veo_prompt = prompt.to_veo_prompt()
         dialogue = prompt.get_dialogue()
+        has_dialogue = bool(dialogue.strip())
+
+        # Save generation info to metadata
         self.scene_manager.save_generation_info(
             scene_id=scene_id,
             prompt=veo_prompt,
@@ -134,7 +298,7 @@ class VideoProductionWorkflow:
             input_image=input_image,
             provider=provider,
             model=model,
-            dialogue=dialogue if dialogue and dialogue.strip() else None
+            dialogue=dialogue if has_dialogue else None
         )
 
         result = {
@@ -142,19 +306,33 @@ class VideoProductionWorkflow:
             "scene_path": scene_path
         }
 
+        # TTS only needs the dialogue text, so it runs in the background while
+        # the video is generated; lip-sync is the first step needing both
+        tts_future = None
+        prores_future = None
+        stage_executor = self._stage_executor
+
         try:
+            if has_dialogue:
+                logger.info("Step 3: Generating TTS audio (in parallel with video generation)")
+                tts_future = stage_executor.submit(
+                    self.tts_client.generate_speech,
+                    text=dialogue,
+                    output_path=audio_path,
+                    voice_id=voice_id
+                )
+
             # Step 1: Generate video
             if input_image:
-                logger.info(f"Step 1: Generating video from image with {provider}")
-                logger.info(f"Input image: {input_image}")
+                logger.info("Step 1: Generating video from image with %s", provider)
+                logger.info("Input image: %s", input_image)
             elif input_video:
-                logger.info(f"Step 1: Extending video with {provider}")
-                logger.info(f"Input video: {input_video}")
+                logger.info("Step 1: Extending video with %s", provider)
+                logger.info("Input video: %s", input_video)
             else:
-                logger.info(f"Step 1: Generating video with {provider}")
+                logger.info("Step 1: Generating video with %s", provider)
 
-            veo_prompt = prompt.to_veo_prompt()
-            logger.info(f"Veo prompt: {veo_prompt}")
+            logger.info("Veo prompt: %s", veo_prompt)
 
             job = self.video_client.generate_video(
                 prompt=veo_prompt,
@@ -163,62 +341,59 @@ class VideoProductionWorkflow:
             )
             job_status = self.video_client.wait_for_completion(job["job_id"])
 
-            logger.info(f"Video generated successfully")
+            logger.info("Video generated successfully")
 
-            # Step 2: Save video and convert to ProRes
-            logger.info(f"Step 2: Saving video and converting to ProRes")
+            # Step 2: Save video
+            logger.info("Step 2: Saving video")
             self.scene_manager.update_scene_status(scene_id, "processing")
 
-            raw_video_path = os.path.join(scene_path, f"{scene_id}_raw.mp4")
             self.video_client.save_video(job["job_id"], raw_video_path)
 
-            prores_path = os.path.join(scene_path, f"{scene_id}_prores.mov")
-            self.video_processor.convert_to_prores(raw_video_path, prores_path)
-
             self.scene_manager.save_file_reference(scene_id, "raw_video", raw_video_path)
-            self.scene_manager.save_file_reference(scene_id, "prores_video", prores_path)
-
             result["raw_video"] = raw_video_path
-            result["prores_video"] = prores_path
 
-            # Step 3: Generate TTS audio (if dialogue exists)
-            dialogue = prompt.get_dialogue()
+            # Lip-sync reads the raw MP4, so the raw clip is only encoded to
+            # ProRes when it is the final deliverable; that encode runs
+            # while TTS finishes
+            if encode_prores and (not has_dialogue or skip_lipsync):
+                logger.info("Step 2: Converting video to ProRes")
+                prores_future = stage_executor.submit(
+                    self.video_processor.convert_to_prores,
+                    raw_video_path,
+                    prores_path
+                )
 
-            if dialogue and dialogue.strip():
-                logger.info(f"Step 3: Generating TTS audio")
-                self.scene_manager.update_scene_status(scene_id, "generating_audio")
+            # Step 3: Collect TTS audio (if dialogue exists)
+            if tts_future is not None:
+                if not tts_future.done():
+                    logger.info("Step 3: Waiting for TTS audio")
+                    self.scene_manager.update_scene_status(scene_id, "generating_audio")
 
-                audio_path = os.path.join(scene_path, f"{scene_id}_dialogue.wav")
-                self.tts_client.generate_speech(
-                    text=dialogue,
-                    output_path=audio_path,
-                    voice_id=voice_id
-                )
+                tts_future.result()
 
                 self.scene_manager.save_file_reference(scene_id, "audio", audio_path)
                 result["audio"] = audio_path
 
                 # Step 4: Apply lip-sync
                 if not skip_lipsync:
-                    logger.info(f"Step 4: Applying lip-sync")
+                    logger.info("Step 4: Applying lip-sync")
                     self.scene_manager.update_scene_status(scene_id, "lip_syncing")
 
-                    synced_path = os.path.join(scene_path, f"{scene_id}_synced.mp4")
+                    # Step 5 runs during the download: the synced video is
+                    # encoded to ProRes as it arrives (and kept on disk)
+                    streamed = []
+
+                    def encode_while_downloading(chunks, path):
+                        logger.info("Step 5: Converting synced video to ProRes")
+                        self.video_processor.stream_to_prores(chunks, final_prores_path, tee_path=path)
+                        streamed.append(path)
+                        return path
+
                     self.lipsync_client.create_and_wait(
-                        video_path=raw_video_path,
+                        video_path=self._lipsync_video_source(job["job_id"], raw_video_path),
                         audio_path=audio_path,
-                        output_path=synced_path
-                    )
-
-                    # Step 5: Convert synced video to ProRes
-                    logger.info(f"Step 5: Converting synced video to ProRes")
-                    final_prores_path = os.path.join(
-                        scene_path,
-                        f"{scene_id}_final_prores.mov"
-                    )
-                    self.video_processor.convert_to_prores(
-                        synced_path,
-                        final_prores_path
+                        output_path=synced_path,
+                        stream_fn=encode_while_downloading if encode_prores else None
                     )
 
                     self.scene_manager.save_file_reference(
@@ -226,68 +401,144 @@ class VideoProductionWorkflow:
                         "synced_video",
                         synced_path
                     )
-                    self.scene_manager.save_file_reference(
-                        scene_id,
-                        "final_prores",
-                        final_prores_path
-                    )
-
                     result["synced_video"] = synced_path
-                    result["final_prores"] = final_prores_path
+                    result["final"] = synced_path
+
+                    if encode_prores:
+                        # Cached lip-sync results arrive as files
+                        if not streamed:
+                            logger.info("Step 5: Converting synced video to ProRes")
+                            self.video_processor.convert_to_prores(
+                                synced_path,
+                                final_prores_path
+                            )
+
+                        self.scene_manager.save_file_reference(
+                            scene_id,
+                            "final_prores",
+                            final_prores_path
+                        )
+                        result["final_prores"] = final_prores_path
+                        result["final"] = final_prores_path
                 else:
                     logger.info("Skipping lip-sync step")
-                    result["final_prores"] = prores_path
             else:
                 logger.info("No dialogue provided, skipping audio and lip-sync")
+
+            if prores_future is not None:
+                prores_future.result()
+                self.scene_manager.save_file_reference(scene_id, "prores_video", prores_path)
+                result["prores_video"] = prores_path
                 result["final_prores"] = prores_path
+                result["final"] = prores_path
+            elif "final" not in result:
+                result["final"] = raw_video_path
 
-            # Mark as completed
+            # Mark as completed; status updates are buffered, so write them
+            # out before handing back the result
             self.scene_manager.update_scene_status(scene_id, "completed")
-            logger.info(f"=== {scene_id} completed successfully ===")
+            self.scene_manager.flush()
+            logger.info("=== %s completed successfully ===", scene_id)
 
             return result
 
         except Exception as e:
-            logger.error(f"Error processing {scene_id}: {str(e)}")
+            logger.error("Error processing %s: %s", scene_id, e)
             self.scene_manager.update_scene_status(scene_id, "failed")
+            try:
+                self.scene_manager.flush()
+            except Exception as flush_error:
+                logger.error("Error saving metadata for %s: %s", scene_id, flush_error)
             raise
 
     def process_multiple_scenes(
         self,
         scene_configs: list[SceneConfig],
         voice_id: Optional[str] = None,
-        skip_lipsync: bool = False
+        skip_lipsync: bool = False,
+        max_workers: Optional[int] = None,
+        output_format: str = "prores"
     ) -> list[dict]:
         """
-        Process multiple scenes
+        Process multiple scenes concurrently
+
+        Every pipeline step is spent waiting on a remote API or ffmpeg, so
+        scenes run in a thread pool and the batch takes roughly as long as
+        the slowest scene instead of the sum of all of them.
 
         Args:
             scene_configs: List of scene configurations
             voice_id: Optional voice ID for TTS
             skip_lipsync: Skip lip-sync step if True
+            max_workers: Maximum scenes in flight (default: MAX_SCENE_CONCURRENCY
+                         env var, else up to 8)
+            output_format: "prores" or "mp4", see process_scene
 
         Returns:
-            List of results for each scene
+            List of results for each scene, in input order
         """
-        results = []
+        if not scene_configs:
+            return []
 
-        for config in scene_configs:
-            try:
-                result = self.process_scene(
-                    config,
-                    voice_id=voice_id,
-                    skip_lipsync=skip_lipsync
-                )
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Failed to process {config.scene_id}: {str(e)}")
-                results.append({
-                    "scene_id": config.scene_id,
-                    "error": str(e)
-                })
+        # Cap scenes in flight to avoid bursting the providers' rate limits
+        max_workers = min(len(scene_configs), _scene_concurrency(max_workers))
+        self._ensure_stage_workers(STAGES_PER_SCENE * max_workers)
+        results = [None] * len(scene_configs)
+        stop_keepalive = self._start_keepalive()
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        self.process_scene,
+                        config,
+                        voice_id=voice_id,
+                        skip_lipsync=skip_lipsync,
+                        output_format=output_format
+                    ): index
+                    for index, config in enumerate(scene_configs)
+                }
+
+                for future in as_completed(futures):
+                    index = futures[future]
+                    config = scene_configs[index]
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        logger.error("Failed to process %s: %s", config.scene_id, e)
+                        results[index] = {
+                            "scene_id": config.scene_id,
+                            "error": str(e)
+                        }
+        finally:
+            stop_keepalive.set()
 
         return results
 
+    def _lipsync_video_source(self, job_id: str, local_path: str) -> str:
+        """
+        Pick the video source to hand to the lip-sync API
+
+        If the provider left the video in GCS, a signed URL lets D-ID fetch
+        it directly instead of re-uploading the local copy.
+
+        Args:
+            job_id: Video generation job ID
+            local_path: Path to the downloaded video
+
+        Returns:
+            Signed URL or the local path
+        """
+        get_signed_url = getattr(self.video_client, "get_video_signed_url", None)
+        if get_signed_url is None:
+            return local_path
+
+        try:
+            return get_signed_url(job_id) or local_path
+        except Exception as e:
+            logger.warning("Could not sign the video of job %s, uploading local file instead: %s", job_id, e)
+            return local_path
+
     def get_project_status(self) -> dict:
         """
         Get status of all scenes in the project
@@ -10,10 +10,22 @@ from dotenv import load_dotenv
 # Get the project root directory (parent of utils/)
 PROJECT_ROOT = Path(__file__).parent.parent
 
+# Shared helpers sit next to this script; make them importable however the
+# script is run (python utils/x.py, python -m utils.x, or imported)
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from error_kinds import classify_error
+
 # Load environment variables from project root
 load_dotenv(PROJECT_ROOT / ".env")
 
 
+# Known API failures, see error_kinds.classify_error
+ERROR_KINDS = (
+    ("model_not_found", (("404",), ("not found",))),
+    ("permission_denied", (("403", "permission"),)),
+)
+
+
 def check_veo_access():
     """Check if Veo API is accessible"""
 
@@ -95,8 +107,9 @@ def check_veo_access():
 
         except Exception as e:
             error_msg = str(e)
+            kind = classify_error(error_msg, ERROR_KINDS)
 
-            if "404" in error_msg and "not found" in error_msg.lower():
+            if kind == "model_not_found":
                 print("❌ ERROR: Veo model not found in your project")
                 print(f"   Error: {error_msg}")
                 print()
@@ -112,7 +125,7 @@ def check_veo_access():
                 print()
                 return False
 
-            elif "403" in error_msg or "permission" in error_msg.lower():
+            elif kind == "permission_denied":
                 print("❌ ERROR: Permission denied")
                 print(f"   Error: {error_msg}")
                 print()
@@ -0,0 +1,25 @@
+"""
+Classify API error messages for the credential check scripts
+"""
+
+
+def classify_error(error_msg: str, error_kinds):
+    """
+    Return the kind of a known API failure, or None
+
+    Kinds are checked in order. An error is of a kind when its lowercased
+    message contains one substring from each of the kind's groups.
+
+    Args:
+        error_msg: Error message to classify
+        error_kinds: Sequence of (kind, groups) pairs, each group a tuple
+                     of alternative substrings
+
+    Returns:
+        The first matching kind, or None
+    """
+    lower = error_msg.lower()
+    for kind, groups in error_kinds:
+        if all(any(part in lower for part in group) for group in groups):
+            return kind
+    return None
@@ -10,10 +10,24 @@ from dotenv import load_dotenv
 # Get the project root directory (parent of utils/)
 PROJECT_ROOT = Path(__file__).parent.parent
 
+# Shared helpers sit next to this script; make them importable however the
+# script is run (python utils/x.py, python -m utils.x, or imported)
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from error_kinds import classify_error
+
 # Load environment variables from project root
 load_dotenv(PROJECT_ROOT / ".env")
 
 
+# Known API failures, see error_kinds.classify_error
+ERROR_KINDS = (
+    ("invalid_key", (("401", "unauthorized"),)),
+    ("forbidden", (("403", "forbidden"),)),
+    ("limited_permissions", (("permission",), ("voices_read",))),
+    ("rate_limited", (("429", "rate limit"),)),
+)
+
+
 def test_elevenlabs_credentials():
     """Test ElevenLabs API credentials"""
 
@@ -79,20 +93,21 @@ def test_elevenlabs_credentials():
 
     except Exception as e:
         error_msg = str(e)
+        kind = classify_error(error_msg, ERROR_KINDS)
 
-        if "401" in error_msg or "unauthorized" in error_msg.lower():
+        if kind == "invalid_key":
             print("❌ ERROR: Invalid API key")
             print(f"   Error: {error_msg}")
             print()
             print("   Please check your API key at: https://elevenlabs.io/")
             return False
-        elif "403" in error_msg or "forbidden" in error_msg.lower():
+        elif kind == "forbidden":
             print("❌ ERROR: API key valid but access forbidden")
             print(f"   Error: {error_msg}")
             print()
             print("   Your account may be suspended or have restrictions.")
             return False
-        elif "permission" in error_msg.lower() and "voices_read" in error_msg.lower():
+        elif kind == "limited_permissions":
             print("⚠️  WARNING: API key is valid but has limited permissions")
             print(f"   Error: {error_msg}")
             print()
@@ -101,7 +116,7 @@ def test_elevenlabs_credentials():
             print()
             # Set voice_list to empty to skip voice verification
             voice_list = []
-        elif "429" in error_msg or "rate limit" in error_msg.lower():
+        elif kind == "rate_limited":
             print("⚠️  WARNING: Rate limit exceeded")
             print(f"   Error: {error_msg}")
             print()
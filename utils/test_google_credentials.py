@@ -4,16 +4,29 @@ Test Google Cloud credentials in isolation
 """
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
 # Get the project root directory (parent of utils/)
 PROJECT_ROOT = Path(__file__).parent.parent
 
+# Shared helpers sit next to this script; make them importable however the
+# script is run (python utils/x.py, python -m utils.x, or imported)
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from error_kinds import classify_error
+
 # Load environment variables from project root
 load_dotenv(PROJECT_ROOT / ".env")
 
 
+# Known API failures, see error_kinds.classify_error
+ERROR_KINDS = (
+    ("limited_permissions", (("403", "permission"),)),
+    ("api_not_enabled", (("not enabled", "404"),)),
+)
+
+
 def test_credentials():
     """Test Google Cloud credentials"""
 
@@ -93,9 +106,44 @@ def test_credentials():
         print(f"❌ ERROR: Failed to load credentials: {str(e)}")
         return False
 
-    # Step 4: Test authentication with Google Cloud
-    print("Step 4: Testing authentication with Google Cloud...")
+    # Steps 4 and 5 only need the loaded credentials, so they run together
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        auth_future = executor.submit(check_authentication, project_id, location, credentials)
+        api_future = executor.submit(check_api_access, project_id, location, credentials)
+
+        # Report in step order, each as soon as it is known
+        print("Step 4: Testing authentication with Google Cloud...")
+        auth_ok, auth_output = auth_future.result()
+        print(auth_output)
+        if not auth_ok:
+            return False
 
+        print("Step 5: Checking Vertex AI API access...")
+        print(api_future.result())
+
+    # Success summary
+    print("=" * 60)
+    print("✓ CREDENTIALS TEST PASSED")
+    print("=" * 60)
+    print()
+    print("Your Google Cloud credentials are properly configured!")
+    print()
+    print("Next steps:")
+    print("  1. Ensure Vertex AI API is enabled in your project")
+    print("  2. Request access to Veo API (currently in preview)")
+    print("  3. Grant your service account the 'Vertex AI User' role")
+    print()
+
+    return True
+
+
+def check_authentication(project_id: str, location: str, credentials):
+    """
+    Step 4: Initialize the Vertex AI SDK with the loaded credentials
+
+    Returns:
+        Tuple of (success, report text)
+    """
     try:
         from google.cloud import aiplatform
 
@@ -105,23 +153,30 @@ def test_credentials():
             credentials=credentials
         )
 
-        print("✓ Successfully authenticated with Google Cloud")
-        print(f"  Project: {project_id}")
-        print(f"  Location: {location}")
-        print()
+        return True, "\n".join([
+            "✓ Successfully authenticated with Google Cloud",
+            f"  Project: {project_id}",
+            f"  Location: {location}",
+        ]) + "\n"
 
     except Exception as e:
-        print(f"❌ ERROR: Failed to authenticate: {str(e)}")
-        print()
-        print("Common issues:")
-        print("  - Service account doesn't have necessary permissions")
-        print("  - Vertex AI API is not enabled")
-        print("  - Invalid credentials file")
-        return False
-
-    # Step 5: Check API access (optional, requires API to be enabled)
-    print("Step 5: Checking Vertex AI API access...")
-
+        return False, "\n".join([
+            f"❌ ERROR: Failed to authenticate: {str(e)}",
+            "",
+            "Common issues:",
+            "  - Service account doesn't have necessary permissions",
+            "  - Vertex AI API is not enabled",
+            "  - Invalid credentials file",
+        ])
+
+
+def check_api_access(project_id: str, location: str, credentials) -> str:
+    """
+    Step 5: Check Vertex AI API access (optional, requires API to be enabled)
+
+    Returns:
+        Report text
+    """
     try:
         # Try to list models (this will fail if API is not enabled)
         # This is a minimal test that doesn't require special permissions
@@ -137,47 +192,33 @@ def test_credentials():
         )
 
         # This will succeed if API is enabled, even with no models
-        response = client.list_models(request=request)
+        client.list_models(request=request)
 
-        print("✓ Vertex AI API is accessible")
-        print()
+        return "✓ Vertex AI API is accessible\n"
 
     except Exception as e:
         error_msg = str(e)
-
-        if "403" in error_msg or "permission" in error_msg.lower():
-            print("⚠️  WARNING: API is accessible but permissions may be limited")
-            print(f"   Error: {error_msg}")
-            print()
-            print("   Your credentials work, but the service account may need additional roles:")
-            print("   - Vertex AI User")
-            print("   - Storage Object Viewer (if using Cloud Storage)")
-            print()
-        elif "not enabled" in error_msg.lower() or "404" in error_msg:
-            print("⚠️  WARNING: Vertex AI API may not be enabled")
-            print(f"   Error: {error_msg}")
-            print()
-            print("   Enable the API at:")
-            print(f"   https://console.cloud.google.com/apis/library/aiplatform.googleapis.com?project={project_id}")
-            print()
+        kind = classify_error(error_msg, ERROR_KINDS)
+
+        if kind == "limited_permissions":
+            return "\n".join([
+                "⚠️  WARNING: API is accessible but permissions may be limited",
+                f"   Error: {error_msg}",
+                "",
+                "   Your credentials work, but the service account may need additional roles:",
+                "   - Vertex AI User",
+                "   - Storage Object Viewer (if using Cloud Storage)",
+            ]) + "\n"
+        elif kind == "api_not_enabled":
+            return "\n".join([
+                "⚠️  WARNING: Vertex AI API may not be enabled",
+                f"   Error: {error_msg}",
+                "",
+                "   Enable the API at:",
+                f"   https://console.cloud.google.com/apis/library/aiplatform.googleapis.com?project={project_id}",
+            ]) + "\n"
         else:
-            print(f"⚠️  WARNING: Could not verify API access: {error_msg}")
-            print()
-
-    # Success summary
-    print("=" * 60)
-    print("✓ CREDENTIALS TEST PASSED")
-    print("=" * 60)
-    print()
-    print("Your Google Cloud credentials are properly configured!")
-    print()
-    print("Next steps:")
-    print("  1. Ensure Vertex AI API is enabled in your project")
-    print("  2. Request access to Veo API (currently in preview)")
-    print("  3. Grant your service account the 'Vertex AI User' role")
-    print()
-
-    return True
+            return f"⚠️  WARNING: Could not verify API access: {error_msg}\n"
 
 
 if __name__ == "__main__":